@@ -2,7 +2,7 @@
 Batches Router - Manage batch operations
 
 Endpoints:
-- GET /batches/{id} - Get batch status
+- GET /batches/{id} - Get batch status (optionally long-poll with ?wait_for=)
 - POST /batches/{id}/enrich - Scrape profiles for batch
 - POST /batches/{id}/qualify - Score profiles against ICP
 - GET /batches/{id}/export - Download qualified leads CSV
@@ -24,6 +24,14 @@ router = APIRouter()
 
 _RUNNING_TASKS: set[asyncio.Task] = set()
 
+# Long-poll support: GET /batches/{id}?wait_for=... waits on the batch's event,
+# which is set (and replaced) whenever a worker in this process changes status
+_STATUS_EVENTS: dict[str, asyncio.Event] = {}
+# Long-pollers currently waiting per batch - the batch's event is dropped once
+# the last one leaves, so timed-out waits on idle batches don't pile up
+_STATUS_WAITERS: dict[str, int] = {}
+MAX_WAIT_SECONDS = 60
+
 
 # ============================================
 # Pydantic Models
@@ -68,19 +76,60 @@ class RunResponse(BaseModel):
 # Endpoints
 # ============================================
 
+def _set_batch_status(batch_id: str, status: str, **fields) -> None:
+    """Update a batch's status (plus any extra columns) and wake long-pollers."""
+    supabase.table("batches").update({"status": status, **fields}).eq("id", batch_id).execute()
+    event = _STATUS_EVENTS.pop(batch_id, None)
+    if event:
+        event.set()
+
+
+async def _wait_for_status(batch_id: str, batch: dict, wait_for: str, timeout: float) -> dict:
+    """
+    Wait until the batch reaches wait_for (or fails), or timeout elapses.
+    
+    Returns the latest batch row either way - callers check its status.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    
+    while batch.get("status") not in (wait_for, "failed"):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        event = _STATUS_EVENTS.setdefault(batch_id, asyncio.Event())
+        _STATUS_WAITERS[batch_id] = _STATUS_WAITERS.get(batch_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), remaining)
+        except asyncio.TimeoutError:
+            break
+        finally:
+            _STATUS_WAITERS[batch_id] -= 1
+            if not _STATUS_WAITERS[batch_id]:
+                del _STATUS_WAITERS[batch_id]
+                _STATUS_EVENTS.pop(batch_id, None)
+        batch_result = supabase.table("batches").select("*").eq("id", batch_id).execute()
+        if not batch_result.data:
+            break
+        batch = batch_result.data[0]
+    
+    return batch
+
+
 async def _enrich_worker(batch_id: str, limit: Optional[int] = None) -> None:
     try:
-        supabase.table("batches").update({"status": "enriching"}).eq("id", batch_id).execute()
+        _set_batch_status(batch_id, "enriching")
         result = await enrich_batch(batch_id, limit=limit)
-        supabase.table("batches").update({
-            "status": "enriched",
-            "enriched_count": result["enriched"] + result["from_cache"],
-            "failed_count": result["failed"],
-        }).eq("id", batch_id).execute()
+        _set_batch_status(
+            batch_id,
+            "enriched",
+            enriched_count=result["enriched"] + result["from_cache"],
+            failed_count=result["failed"],
+        )
     except Exception as e:
         # Best-effort error status
         try:
-            supabase.table("batches").update({"status": "failed"}).eq("id", batch_id).execute()
+            _set_batch_status(batch_id, "failed")
         except Exception:
             pass
         print(f"[Batches] Enrich worker failed for {batch_id}: {e}", flush=True)
@@ -96,20 +145,21 @@ async def _qualify_worker(batch_id: str) -> None:
 
         icp_result = supabase.table("client_icps").select("*").eq("client_id", client_id).execute()
         if not icp_result.data:
-            supabase.table("batches").update({"status": "failed"}).eq("id", batch_id).execute()
+            _set_batch_status(batch_id, "failed")
             return
         icp = icp_result.data[0]
 
-        supabase.table("batches").update({"status": "qualifying"}).eq("id", batch_id).execute()
+        _set_batch_status(batch_id, "qualifying")
         result = await qualify_batch(batch_id, icp)
-        supabase.table("batches").update({
-            "status": "qualified",
-            "qualified_count": result["qualified"],
-            "failed_count": (batch.get("failed_count") or 0) + result["failed"],
-        }).eq("id", batch_id).execute()
+        _set_batch_status(
+            batch_id,
+            "qualified",
+            qualified_count=result["qualified"],
+            failed_count=(batch.get("failed_count") or 0) + result["failed"],
+        )
     except Exception as e:
         try:
-            supabase.table("batches").update({"status": "failed"}).eq("id", batch_id).execute()
+            _set_batch_status(batch_id, "failed")
         except Exception:
             pass
         print(f"[Batches] Qualify worker failed for {batch_id}: {e}", flush=True)
@@ -118,12 +168,12 @@ async def _qualify_worker(batch_id: str) -> None:
 async def _run_worker(batch_id: str, limit: Optional[int] = None) -> None:
     # Run end-to-end: enrich -> qualify
     try:
-        supabase.table("batches").update({"status": "running"}).eq("id", batch_id).execute()
+        _set_batch_status(batch_id, "running")
         await _enrich_worker(batch_id, limit=limit)
         await _qualify_worker(batch_id)
     except Exception as e:
         try:
-            supabase.table("batches").update({"status": "failed"}).eq("id", batch_id).execute()
+            _set_batch_status(batch_id, "failed")
         except Exception:
             pass
         print(f"[Batches] Run worker failed for {batch_id}: {e}", flush=True)
@@ -135,8 +185,15 @@ def _start_background(coro: asyncio.coroutines) -> None:
     task.add_done_callback(lambda t: _RUNNING_TASKS.discard(t))
 
 @router.get("/{batch_id}")
-async def get_batch(batch_id: str):
-    """Get batch status and lead summary."""
+async def get_batch(batch_id: str, wait_for: Optional[str] = None, timeout: float = 30):
+    """
+    Get batch status and lead summary.
+    
+    Args:
+        wait_for: Optional status to long-poll for - the response is held until
+            the batch reaches it (or "failed"), instead of clients re-polling
+        timeout: Max seconds to hold a wait_for request (capped at 60)
+    """
     try:
         # Get batch
         batch_result = supabase.table("batches").select("*").eq("id", batch_id).execute()
@@ -146,6 +203,9 @@ async def get_batch(batch_id: str):
         
         batch = batch_result.data[0]
         
+        if wait_for:
+            batch = await _wait_for_status(batch_id, batch, wait_for, min(max(timeout, 0), MAX_WAIT_SECONDS))
+        
         # Get lead counts by status
         leads_result = supabase.table("leads").select("status").eq("batch_id", batch_id).execute()
         
@@ -303,6 +363,46 @@ async def qualify_batch_endpoint(batch_id: str, background: bool = False):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+EXPORT_CSV_HEADER = [
+    "Name",
+    "Profile URL",
+    "Headline",
+    "Company",
+    "Location",
+    "Job Title",
+    "ICP Score",
+    "Match Reasoning"
+]
+
+
+def _iter_export_csv(leads: list):
+    """Yield the export CSV one line at a time (header first)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def _flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+    
+    writer.writerow(EXPORT_CSV_HEADER)
+    yield _flush()
+    
+    for lead in leads:
+        writer.writerow([
+            lead.get("name", ""),
+            lead.get("linkedin_url", ""),
+            lead.get("headline", ""),
+            lead.get("company", ""),
+            lead.get("location", ""),
+            ", ".join(lead.get("current_job_titles") or []),
+            lead.get("icp_score", ""),
+            lead.get("match_reasoning", "")
+        ])
+        yield _flush()
+
+
 @router.get("/{batch_id}/export")
 async def export_batch(batch_id: str, min_score: int = 0):
     """
@@ -320,8 +420,10 @@ async def export_batch(batch_id: str, min_score: int = 0):
         
         batch = batch_result.data[0]
         
-        # Get qualified leads
-        query = supabase.table("leads").select("*").eq("batch_id", batch_id).eq("status", "qualified")
+        # Get qualified leads (just the CSV columns - skip profile_data/embedding)
+        query = supabase.table("leads").select(
+            "id,name,linkedin_url,headline,company,location,current_job_titles,icp_score,match_reasoning"
+        ).eq("batch_id", batch_id).eq("status", "qualified")
         
         if min_score > 0:
             query = query.gte("icp_score", min_score)
@@ -331,52 +433,19 @@ async def export_batch(batch_id: str, min_score: int = 0):
         if not leads_result.data:
             raise HTTPException(status_code=404, detail="No qualified leads to export")
         
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            "Name",
-            "Profile URL",
-            "Headline",
-            "Company",
-            "Location",
-            "Job Title",
-            "ICP Score",
-            "Match Reasoning"
-        ])
-        
-        # Data rows
-        for lead in leads_result.data:
-            writer.writerow([
-                lead.get("name", ""),
-                lead.get("linkedin_url", ""),
-                lead.get("headline", ""),
-                lead.get("company", ""),
-                lead.get("location", ""),
-                ", ".join(lead.get("current_job_titles") or []),
-                lead.get("icp_score", ""),
-                lead.get("match_reasoning", "")
-            ])
-        
         # Update leads to exported status
         lead_ids = [lead["id"] for lead in leads_result.data]
         for lead_id in lead_ids:
             supabase.table("leads").update({"status": "exported"}).eq("id", lead_id).execute()
         
-        # Update batch
-        supabase.table("batches").update({
-            "status": "exported",
-            "exported_count": len(lead_ids)
-        }).eq("id", batch_id).execute()
+        # Update batch (through _set_batch_status so ?wait_for=exported wakes up)
+        _set_batch_status(batch_id, "exported", exported_count=len(lead_ids))
         
-        # Return CSV
-        output.seek(0)
+        # Return CSV, streamed row by row instead of built up as one string
         filename = f"qualified_leads_{batch_id[:8]}.csv"
         
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _iter_export_csv(leads_result.data),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -9,6 +9,7 @@ Endpoints:
 - POST /clients/{id}/sync-icp - Sync ICP from Fathom (Phase 6)
 """
 
+import httpx
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional, List
@@ -19,6 +20,17 @@ from ..services.enrichment import create_leads_from_urls
 
 router = APIRouter()
 
+# Postgres error code for a foreign key violation (PostgREST returns it as 409)
+PG_FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _is_foreign_key_violation(error: httpx.HTTPStatusError) -> bool:
+    """Check whether a failed PostgREST write was rejected by a foreign key."""
+    try:
+        return error.response.json().get("code") == PG_FOREIGN_KEY_VIOLATION
+    except ValueError:
+        return False
+
 
 # ============================================
 # Pydantic Models
@@ -125,11 +137,6 @@ async def get_client(client_id: str):
 async def _upsert_icp(client_id: str, icp: ICPUpdate):
     """Create/update client's ICP criteria (upsert)."""
     try:
-        # Verify client exists
-        client_result = supabase.table("clients").select("id").eq("id", client_id).execute()
-        if not client_result.data:
-            raise HTTPException(status_code=404, detail="Client not found")
-        
         # Build update data (only include non-None fields)
         update_data = {}
         if icp.target_titles is not None:
@@ -148,13 +155,24 @@ async def _upsert_icp(client_id: str, icp: ICPUpdate):
         if update_data:
             payload = {"client_id": client_id, **update_data}
             # Upsert on client_id so this works even if the ICP row doesn't exist yet
+            # No client lookup first - client_icps.client_id references clients.id,
+            # so an unknown client fails the write itself (mapped to 404 below)
             result = supabase.table("client_icps").upsert(payload, on_conflict="client_id").execute()
             return {"status": "updated", "icp": result.data[0] if result.data else None}
         
+        # Nothing to write, so check the client exists to keep the 404 behaviour
+        client_result = supabase.table("clients").select("id").eq("id", client_id).execute()
+        if not client_result.data:
+            raise HTTPException(status_code=404, detail="Client not found")
+        
         return {"status": "no_changes"}
         
     except HTTPException:
         raise
+    except httpx.HTTPStatusError as e:
+        if _is_foreign_key_violation(e):
+            raise HTTPException(status_code=404, detail="Client not found")
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -184,12 +202,12 @@ async def ingest_html(client_id: str, file: UploadFile = File(...)):
         if not client_result.data:
             raise HTTPException(status_code=404, detail="Client not found")
         
-        # Read file content
+        # Read file content - the parser scans the raw bytes, so skip decoding
+        # the whole upload to str (only matched URLs are decoded)
         content = await file.read()
-        html_content = content.decode('utf-8', errors='ignore')
         
         # Extract LinkedIn URLs
-        urls = extract_linkedin_urls(html_content)
+        urls = extract_linkedin_urls(content)
         
         if not urls:
             raise HTTPException(status_code=400, detail="No LinkedIn URLs found in file")
@@ -4,8 +4,11 @@ Copied from apify-api/api-backend/services/supabase_client.py
 """
 
 import os
+import json
+import asyncio
 import httpx
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Any, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +19,17 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("Missing SUPABASE_URL or SUPABASE_KEY environment variables")
 
+# Connection pool for the shared client - every script and request goes
+# through the one `supabase` instance, so keep-alive connections are reused
+# across calls (and across threads in update_rows) instead of re-handshaking
+HTTP_TIMEOUT_SECONDS = 30.0
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_MAX_CONNECTIONS = 64
+
+# Request bodies are encoded compactly (no spaces after separators, UTF-8
+# left as-is) - bulk upserts of profile_data are large enough for it to matter
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 
 class SupabaseTable:
     """Simple table query builder."""
@@ -108,9 +122,28 @@ class SupabaseTable:
         self._operation = "insert"
         return self
     
-    def upsert(self, data: Dict[str, Any], on_conflict: str = None) -> "SupabaseTable":
+    def upsert(
+        self, 
+        data: Any, 
+        on_conflict: str = None,
+        ignore_duplicates: bool = False,
+        returning: str = "representation"
+    ) -> "SupabaseTable":
+        """
+        Insert-or-update one row (dict) or many rows (list of dicts) in one request.
+        
+        Args:
+            data: Row dict, or list of row dicts for a bulk upsert
+            on_conflict: Unique column(s) to resolve conflicts on
+            ignore_duplicates: Skip conflicting rows instead of merging them
+                (only newly inserted rows come back in the response)
+            returning: "representation" to get rows back (narrow with
+                .select()), or "minimal" for an empty response
+        """
         self._upsert_data = data
         self._upsert_conflict = on_conflict
+        self._upsert_resolution = "ignore-duplicates" if ignore_duplicates else "merge-duplicates"
+        self._upsert_returning = returning
         self._operation = "upsert"
         return self
     
@@ -133,9 +166,16 @@ class SupabaseTable:
         
         # UPSERT operation
         if hasattr(self, '_operation') and self._operation == "upsert":
-            headers = {"Prefer": "resolution=merge-duplicates"}
+            # Both preferences go in one header - sending only resolution= would
+            # replace the client's default return=representation
+            headers = {"Prefer": f"resolution={self._upsert_resolution},return={self._upsert_returning}"}
+            params = []
             if self._upsert_conflict:
-                url = f"{url}?on_conflict={self._upsert_conflict}"
+                params.append(f"on_conflict={self._upsert_conflict}")
+            if self._select_columns != "*":
+                params.append(f"select={self._select_columns}")
+            if params:
+                url = f"{url}?{'&'.join(params)}"
             response = self.client._request("POST", url, json=self._upsert_data, extra_headers=headers)
             return SupabaseResponse(response)
         
@@ -161,6 +201,31 @@ class SupabaseTable:
         url = self._build_url()
         response = self.client._request("GET", url)
         return SupabaseResponse(response)
+    
+    async def execute_async(self) -> "SupabaseResponse":
+        """
+        Awaitable execute() for use in async code (e.g. asyncio.gather).
+        
+        Runs the request on a worker thread over the same pooled client, so
+        concurrent calls share keep-alive connections instead of blocking
+        the event loop one at a time.
+        """
+        return await asyncio.to_thread(self.execute)
+    
+    def iter_rows(self, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Run a SELECT page by page and yield rows.
+        
+        PostgREST caps each response (1000 rows by default), so reads that
+        can exceed that must page with range(). Add an order() for stable pages.
+        """
+        offset = 0
+        while True:
+            page = self.range(offset, offset + page_size - 1).execute().data
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
 
 class SupabaseResponse:
@@ -168,8 +233,12 @@ class SupabaseResponse:
     
     def __init__(self, response: httpx.Response):
         self.status_code = response.status_code
+        # Parse the raw bytes directly - checking response.text first decoded
+        # the whole body to a str just to test for emptiness, which is
+        # expensive on large profile_data payloads
         try:
-            self.data = response.json() if response.text else []
+            content = response.content
+            self.data = json.loads(content) if content else []
         except:
             self.data = []
         
@@ -191,7 +260,13 @@ class SupabaseClient:
             "Content-Type": "application/json",
             "Prefer": "return=representation"
         }
-        self._client = httpx.Client(timeout=30.0)
+        self._client = httpx.Client(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP_MAX_CONNECTIONS,
+            ),
+        )
     
     def _request(
         self, 
@@ -204,7 +279,8 @@ class SupabaseClient:
         if extra_headers:
             headers.update(extra_headers)
         
-        response = self._client.request(method, url, json=json, headers=headers)
+        content = _encode_json(json).encode() if json is not None else None
+        response = self._client.request(method, url, content=content, headers=headers)
         if response.status_code >= 400:
             print(f"[Supabase Error] {method} {url}")
             print(f"[Supabase Error] Status: {response.status_code}")
@@ -218,6 +294,48 @@ class SupabaseClient:
     def rpc(self, function_name: str, params: Dict[str, Any] = None) -> "SupabaseRPC":
         """Call a Postgres function via RPC."""
         return SupabaseRPC(self, function_name, params or {})
+    
+    def update_rows(
+        self, 
+        table_name: str, 
+        rows: List[Dict[str, Any]], 
+        key: str = "id",
+        max_workers: int = 16
+    ) -> int:
+        """
+        Apply a different update to each row, concurrently.
+        
+        PostgREST has no bulk "PATCH many rows with different values" call,
+        so each row is still one PATCH - but they run in parallel over the
+        shared connection pool instead of one round-trip at a time.
+        
+        Args:
+            table_name: Table to update
+            rows: Dicts containing the key column plus the columns to set
+            key: Column used to match each row (default: id)
+            max_workers: Max concurrent requests
+        
+        Returns:
+            Number of rows updated successfully
+        """
+        if not rows:
+            return 0
+        
+        def _update(row: Dict[str, Any]) -> None:
+            data = {k: v for k, v in row.items() if k != key}
+            self.table(table_name).update(data).eq(key, row[key]).execute()
+        
+        updated = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(rows))) as pool:
+            futures = {pool.submit(_update, row): row for row in rows}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    updated += 1
+                except Exception as e:
+                    print(f"[Supabase Error] Update failed for {key}={futures[future][key]}: {e}")
+        
+        return updated
 
 
 class SupabaseRPC:
@@ -232,6 +350,10 @@ class SupabaseRPC:
         url = f"{self.client.url}/rest/v1/rpc/{self.function_name}"
         response = self.client._request("POST", url, json=self.params)
         return SupabaseResponse(response)
+    
+    async def execute_async(self) -> SupabaseResponse:
+        """Awaitable execute() - see SupabaseTable.execute_async."""
+        return await asyncio.to_thread(self.execute)
 
 
 # Create the client instance
@@ -9,6 +9,7 @@ Handles:
 
 from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 
 from .db.supabase_client import supabase
 from .scraping.apify_scraper import scraper, normalize_linkedin_url, extract_urn_from_url
@@ -16,6 +17,10 @@ from .matching.embeddings import generate_profile_embedding, format_embedding_fo
 from .matching.classifier import classify_profile
 
 
+# Rows per bulk insert request when creating leads
+LEAD_INSERT_CHUNK_SIZE = 500
+
+
 async def create_leads_from_urls(
     client_id: str, 
     batch_id: str, 
@@ -35,34 +40,94 @@ async def create_leads_from_urls(
     created = 0
     duplicates = 0
     
-    for url in urls:
-        normalized_url = normalize_linkedin_url(url)
-        public_id = extract_urn_from_url(url)
-        
+    # Normalize + dedupe up front (order preserved) so repeats in the input
+    # aren't sent to the database at all
+    normalized_urls = [u for u in map(normalize_linkedin_url, urls) if u]
+    unique_urls = list(dict.fromkeys(normalized_urls))
+    duplicates += len(normalized_urls) - len(unique_urls)
+    
+    rows = [
+        {
+            "client_id": client_id,
+            "batch_id": batch_id,
+            "linkedin_url": normalized_url,
+            "public_identifier": extract_urn_from_url(normalized_url),
+            "status": "discovered"
+        }
+        for normalized_url in unique_urls
+    ]
+    
+    def upsert_leads(chunk: List[Dict[str, Any]]) -> int:
+        """Insert new leads, skipping existing linkedin_urls; returns rows inserted."""
+        result = supabase.table("leads").select("id").upsert(
+            chunk, on_conflict="linkedin_url", ignore_duplicates=True
+        ).execute()
+        return len(result.data)
+    
+    failed = 0
+    
+    # Bulk upsert in chunks: existing linkedin_urls are skipped by Postgres
+    # (ignore-duplicates), and only the newly inserted rows' ids come back
+    for i in range(0, len(rows), LEAD_INSERT_CHUNK_SIZE):
+        chunk = rows[i:i + LEAD_INSERT_CHUNK_SIZE]
         try:
-            lead_data = {
-                "client_id": client_id,
-                "batch_id": batch_id,
-                "linkedin_url": normalized_url,
-                "public_identifier": public_id,
-                "status": "discovered"
-            }
-            
-            supabase.table("leads").insert(lead_data).execute()
-            created += 1
-            
+            inserted = upsert_leads(chunk)
+            created += inserted
+            duplicates += len(chunk) - inserted
         except Exception as e:
-            error_str = str(e).lower()
-            # Check for duplicate key error
-            if "duplicate" in error_str or "unique" in error_str or "23505" in error_str:
-                duplicates += 1
-            else:
-                print(f"[Enrichment] Error creating lead for {url}: {e}")
-    
-    print(f"[Enrichment] Created {created} leads, {duplicates} duplicates skipped")
+            # One bad row fails the whole request - retry the chunk row by row
+            # so only that lead is lost, as with one insert per URL
+            print(f"[Enrichment] Error creating {len(chunk)} leads, retrying one at a time: {e}")
+            for row in chunk:
+                try:
+                    inserted = upsert_leads([row])
+                    created += inserted
+                    duplicates += 1 - inserted
+                except Exception as row_error:
+                    failed += 1
+                    print(f"[Enrichment] Error creating lead for {row['linkedin_url']}: {row_error}")
+    
+    print(f"[Enrichment] Created {created} leads, {duplicates} duplicates skipped"
+          + (f", {failed} failed" if failed else ""))
     return created, duplicates
 
 
+# Substrings that mark a duration rather than a company/title (e.g. "8 yrs 1 mo")
+DURATION_MARKERS = ("yrs", "mos", " yr", " mo", "year", "month")
+
+# Employment-type values Apify sometimes puts in the company/title slot
+JUNK_VALUES = frozenset({"full-time", "part-time", "contract", "self-employed", "freelance"})
+
+# Universities, Inc, LLC, etc. are companies
+COMPANY_INDICATORS = ("university", "college", " inc", " llc", " ltd", " corp", 
+                      "diagnostics", "solutions", "technologies", "consulting")
+
+
+# The same few strings ("Full-time", common titles/companies) repeat across
+# positions and profiles, and each is checked several times per position -
+# cache the verdicts instead of re-lowercasing and re-scanning every time.
+@lru_cache(maxsize=4096)
+def is_duration_or_junk(text: str) -> bool:
+    """Check if text is a duration or junk value, not a real company/title."""
+    if not text:
+        return False  # Empty/None is not "junk", just missing
+    text_lower = text.lower().strip()
+    # Duration patterns
+    if any(x in text_lower for x in DURATION_MARKERS):
+        return True
+    # Junk values
+    return text_lower in JUNK_VALUES
+
+
+@lru_cache(maxsize=4096)
+def looks_like_company_name(text: str) -> bool:
+    """Check if text looks more like a company name than a job title."""
+    if not text:
+        return False
+    text_lower = text.lower()
+    return any(ind in text_lower for ind in COMPANY_INDICATORS)
+
+
 def extract_profile_fields(profile_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract key fields from raw profile data for the leads table.
@@ -74,29 +139,6 @@ def extract_profile_fields(profile_data: Dict[str, Any]) -> Dict[str, Any]:
     if not profile_data:
         return {}
     
-    def is_duration_or_junk(text: str) -> bool:
-        """Check if text is a duration or junk value, not a real company/title."""
-        if not text:
-            return False  # Empty/None is not "junk", just missing
-        text_lower = text.lower().strip()
-        # Duration patterns
-        if any(x in text_lower for x in ["yrs", "mos", " yr", " mo", "year", "month"]):
-            return True
-        # Junk values
-        if text_lower in ["full-time", "part-time", "contract", "self-employed", "freelance"]:
-            return True
-        return False
-    
-    def looks_like_company_name(text: str) -> bool:
-        """Check if text looks more like a company name than a job title."""
-        if not text:
-            return False
-        text_lower = text.lower()
-        # Universities, Inc, LLC, etc. are companies
-        company_indicators = ["university", "college", " inc", " llc", " ltd", " corp", 
-                            "diagnostics", "solutions", "technologies", "consulting"]
-        return any(ind in text_lower for ind in company_indicators)
-    
     # Build name from first/last
     first_name = profile_data.get("firstName", "").strip()
     last_name = profile_data.get("lastName", "").strip()
@@ -1,6 +1,7 @@
 # ICP matching services
 from .icp_matcher import qualify_batch, score_profile
 from .embeddings import (
+    generate_embeddings,
     generate_profile_embedding,
     generate_icp_embedding,
     format_embedding_for_postgres
@@ -11,6 +12,7 @@ from .reranker import get_reranker, JinaReranker, BaseReranker
 __all__ = [
     "qualify_batch", 
     "score_profile",
+    "generate_embeddings",
     "generate_profile_embedding",
     "generate_icp_embedding",
     "format_embedding_for_postgres",
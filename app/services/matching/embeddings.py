@@ -18,6 +18,9 @@ client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
 
+# Inputs per embeddings API call when embedding many texts at once
+EMBEDDING_BATCH_SIZE = 64
+
 
 def create_profile_text(lead: Dict[str, Any]) -> str:
     """
@@ -111,6 +114,39 @@ def generate_embedding(text: str) -> Optional[List[float]]:
         return None
 
 
+def generate_embeddings(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    Generate embeddings for many texts, EMBEDDING_BATCH_SIZE per API call.
+    
+    One request per chunk instead of one per text - the round-trip dominates
+    the cost of embedding a single profile.
+    
+    Args:
+        texts: Texts to embed
+    
+    Returns:
+        List aligned with texts: embedding, or None for empty text / failed chunk
+    """
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+    
+    # The API rejects empty inputs - skip them but remember original positions
+    indexed = [(i, text.strip()) for i, text in enumerate(texts) if text and text.strip()]
+    
+    for start in range(0, len(indexed), EMBEDDING_BATCH_SIZE):
+        chunk = indexed[start:start + EMBEDDING_BATCH_SIZE]
+        try:
+            response = client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=[text for _, text in chunk]
+            )
+            for item in response.data:
+                embeddings[chunk[item.index][0]] = item.embedding
+        except Exception as e:
+            print(f"[Embeddings] Error generating batch embeddings: {e}")
+    
+    return embeddings
+
+
 def generate_profile_embedding(lead: Dict[str, Any]) -> Optional[List[float]]:
     """
     Generate an embedding for a lead's profile.
@@ -145,4 +181,4 @@ def format_embedding_for_postgres(embedding: List[float]) -> str:
     
     Postgres expects: '[0.1, 0.2, 0.3, ...]'
     """
-    return f"[{','.join(str(x) for x in embedding)}]"
+    return f"[{','.join(map(str, embedding))}]"
@@ -87,9 +87,11 @@ def vector_search_leads(icp_embedding: List[float], batch_id: str) -> List[Dict[
         
     except Exception as e:
         print(f"[ICP Matcher] Vector search error: {e}")
-        # Fallback: return all enriched leads without ranking
-        result = supabase.table("leads").select("*").eq("batch_id", batch_id).eq("status", "enriched").execute()
-        return result.data or []
+        # Fallback: return all enriched leads without ranking (paged, so
+        # batches over the 1000-row response cap aren't truncated)
+        return list(
+            supabase.table("leads").select("*").eq("batch_id", batch_id).eq("status", "enriched").order("id").iter_rows()
+        )
 
 
 # =============================================================================
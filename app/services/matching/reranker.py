@@ -6,15 +6,39 @@ Swap implementations to compare via LangSmith evals.
 """
 
 import os
+import json
+import hashlib
+import sqlite3
+import threading
 import httpx
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
 load_dotenv(".env.local")
 load_dotenv()
 
+# Max concurrent Jina requests (multi-query batches and chunked document lists).
+# Enforced process-wide by _rerank_request_slots, so nested fan-out (several
+# queries, each split into chunks) still can't exceed it.
+RERANK_BATCH_WORKERS = 8
+
+# Documents per Jina request - longer lists are split into length-sorted chunks
+RERANK_CHUNK_SIZE = 64
+
+# Rerank results kept in memory, keyed by (query, documents, top_n)
+RERANK_CACHE_MAX_ENTRIES = 1000
+
+# Optional SQLite file that persists rerank results across runs (unset = memory
+# only). It's purely a cache - safe to delete at any time. Oldest entries are
+# dropped once it holds RERANK_CACHE_MAX_DISK_ENTRIES.
+RERANK_CACHE_PATH = os.getenv("RERANK_CACHE_PATH")
+RERANK_CACHE_MAX_DISK_ENTRIES = 10000
+
 
 @dataclass
 class RankedResult:
@@ -25,6 +49,124 @@ class RankedResult:
     lead_id: Optional[str] = None  # Optional reference to lead
 
 
+_rerank_cache: "OrderedDict[str, List[Tuple[int, float]]]" = OrderedDict()
+_rerank_cache_lock = threading.Lock()
+_rerank_cache_db: Optional[sqlite3.Connection] = None
+
+_rerank_request_slots = threading.BoundedSemaphore(RERANK_BATCH_WORKERS)
+
+
+def _rerank_cache_key(model: str, query: str, documents: List[str], top_n: Optional[int]) -> str:
+    """
+    Hash the model, query, document list and top_n into a cache key.
+    
+    The model is part of the key so a persisted cache never serves scores
+    from a different reranker model.
+    """
+    digest = hashlib.sha1(model.encode())
+    digest.update(b"\x01")
+    digest.update(query.encode())
+    digest.update(b"\x01")
+    digest.update(b"\x00".join(doc.encode() for doc in documents))
+    digest.update(f"\x01{top_n}".encode())
+    return digest.hexdigest()
+
+
+def _get_rerank_cache_db() -> Optional[sqlite3.Connection]:
+    """Open the persistent cache on first use (caller holds _rerank_cache_lock)."""
+    global _rerank_cache_db
+    if _rerank_cache_db is None and RERANK_CACHE_PATH:
+        _rerank_cache_db = sqlite3.connect(RERANK_CACHE_PATH, check_same_thread=False)
+        _rerank_cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS rerank_cache (key TEXT PRIMARY KEY, results TEXT NOT NULL)"
+        )
+    return _rerank_cache_db
+
+
+def _rerank_cache_get(key: str) -> Optional[List[Tuple[int, float]]]:
+    """Look a key up in memory, then in the persistent cache if enabled."""
+    with _rerank_cache_lock:
+        hit = _rerank_cache.get(key)
+        if hit is not None:
+            _rerank_cache.move_to_end(key)
+            return hit
+        
+        db = _get_rerank_cache_db()
+        if db is None:
+            return None
+        row = db.execute("SELECT results FROM rerank_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        hit = [tuple(pair) for pair in json.loads(row[0])]
+        _rerank_cache_put_memory(key, hit)
+        return hit
+
+
+def _rerank_cache_put_memory(key: str, pairs: List[Tuple[int, float]]) -> None:
+    """Insert into the in-memory LRU (caller holds _rerank_cache_lock)."""
+    _rerank_cache[key] = pairs
+    _rerank_cache.move_to_end(key)
+    if len(_rerank_cache) > RERANK_CACHE_MAX_ENTRIES:
+        _rerank_cache.popitem(last=False)
+
+
+def _rerank_cache_put(key: str, pairs: List[Tuple[int, float]]) -> None:
+    """Store results in memory, and on disk if the persistent cache is enabled."""
+    with _rerank_cache_lock:
+        _rerank_cache_put_memory(key, pairs)
+        db = _get_rerank_cache_db()
+        if db is not None:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO rerank_cache (key, results) VALUES (?, ?)",
+                    (key, json.dumps(pairs))
+                )
+                # Replaced rows get a new rowid, so rowid order is write order
+                db.execute(
+                    "DELETE FROM rerank_cache WHERE rowid IN "
+                    "(SELECT rowid FROM rerank_cache ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (RERANK_CACHE_MAX_DISK_ENTRIES,)
+                )
+
+
+def cached_rerank(func):
+    """
+    Cache rerank() results in an LRU keyed by (model, query, documents, top_n).
+    
+    Only (index, score) pairs are stored, so a hit is rebuilt against the
+    caller's documents and lead_ids without another API call. Lead IDs are
+    not part of the key - they're just labels for the same documents.
+    
+    Set RERANK_CACHE_PATH to also persist results to SQLite, so repeated
+    script runs on the same inputs don't call the API again. The model is
+    the class's MODEL (or the reranker name if it has none).
+    """
+    @wraps(func)
+    def wrapper(self, query, documents, top_n=None, lead_ids=None):
+        if not documents:
+            return func(self, query, documents, top_n, lead_ids)
+        
+        model = getattr(self, "MODEL", None) or self.name
+        key = _rerank_cache_key(model, query, documents, top_n)
+        hit = _rerank_cache_get(key)
+        if hit is not None:
+            return [
+                RankedResult(
+                    index=idx,
+                    text=documents[idx],
+                    score=score,
+                    lead_id=lead_ids[idx] if lead_ids and idx < len(lead_ids) else None
+                )
+                for idx, score in hit
+            ]
+        
+        results = func(self, query, documents, top_n, lead_ids)
+        _rerank_cache_put(key, [(r.index, r.score) for r in results])
+        return results
+    
+    return wrapper
+
+
 class BaseReranker(ABC):
     """Abstract base class for rerankers."""
     
@@ -50,6 +192,30 @@ class BaseReranker(ABC):
         """
         pass
     
+    def rerank_batch(
+        self,
+        queries: List[str],
+        documents: List[str],
+        top_n: Optional[int] = None,
+        lead_ids: Optional[List[str]] = None
+    ) -> List[List[RankedResult]]:
+        """
+        Rerank the same documents against several queries.
+        
+        Default implementation runs rerank() once per query; backends that
+        can do better (e.g. overlap network calls) override this.
+        
+        Args:
+            queries: Search queries (e.g. one per ICP)
+            documents: List of document texts (profile summaries)
+            top_n: Number of results to return per query (None = return ALL)
+            lead_ids: Optional list of lead IDs matching documents
+        
+        Returns:
+            One result list per query, aligned with the input order
+        """
+        return [self.rerank(query, documents, top_n, lead_ids) for query in queries]
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -63,15 +229,18 @@ class JinaReranker(BaseReranker):
     API_URL = "https://api.jina.ai/v1/rerank"
     MODEL = "jina-reranker-v2-base-multilingual"
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.Client] = None):
         self.api_key = os.getenv("JINA_API_KEY")
         if not self.api_key:
             raise ValueError("Missing JINA_API_KEY environment variable")
+        # Reused across rerank() calls so repeated/chunked calls keep the connection alive
+        self._client = client or httpx.Client(timeout=30.0)
     
     @property
     def name(self) -> str:
         return "jina"
     
+    @cached_rerank
     def rerank(
         self, 
         query: str, 
@@ -91,36 +260,24 @@ class JinaReranker(BaseReranker):
             top_n = min(top_n, len(documents))
         
         try:
-            response = httpx.post(
-                self.API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.MODEL,
-                    "query": query,
-                    "documents": documents,
-                    "top_n": top_n
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            results = []
+            if len(documents) <= RERANK_CHUNK_SIZE:
+                scored = self._post_rerank(query, documents, top_n)
+            else:
+                scored = self._rerank_chunked(query, documents)
             
-            for item in data.get("results", []):
-                idx = item.get("index", 0)
-                results.append(RankedResult(
+            results = [
+                RankedResult(
                     index=idx,
                     text=documents[idx] if idx < len(documents) else "",
-                    score=item.get("relevance_score", 0.0),
+                    score=score,
                     lead_id=lead_ids[idx] if lead_ids and idx < len(lead_ids) else None
-                ))
+                )
+                for idx, score in scored
+            ]
             
             # Sort by score descending (should already be sorted, but ensure)
             results.sort(key=lambda x: x.score, reverse=True)
+            results = results[:top_n]
             
             print(f"[Jina Reranker] Reranked {len(documents)} docs -> {len(results)} results")
             
@@ -132,6 +289,73 @@ class JinaReranker(BaseReranker):
         except Exception as e:
             print(f"[Jina Reranker] Error: {e}")
             raise
+    
+    def _post_rerank(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        """Send one rerank request; returns (index into documents, score) pairs."""
+        # Only the HTTP call holds a slot, so nested thread pools can't deadlock on it
+        with _rerank_request_slots:
+            response = self._client.post(
+                self.API_URL,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.MODEL,
+                    "query": query,
+                    "documents": documents,
+                    "top_n": top_n
+                },
+                timeout=30.0
+            )
+        response.raise_for_status()
+        
+        # Parse the raw bytes directly - response.json() decodes to str first
+        data = json.loads(response.content)
+        return [
+            (item.get("index", 0), item.get("relevance_score", 0.0))
+            for item in data.get("results", [])
+        ]
+    
+    def _rerank_chunked(self, query: str, documents: List[str]) -> List[Tuple[int, float]]:
+        """
+        Score a large document list as several concurrent requests.
+        
+        Documents are grouped by length before chunking, so each request
+        holds similar-length texts and less of the model's batch is padding.
+        Scores are per (query, document), so chunks can be merged directly.
+        """
+        order = sorted(range(len(documents)), key=lambda i: len(documents[i]))
+        chunks = [order[i:i + RERANK_CHUNK_SIZE] for i in range(0, len(order), RERANK_CHUNK_SIZE)]
+        
+        def score_chunk(chunk: List[int]) -> List[Tuple[int, float]]:
+            scored = self._post_rerank(query, [documents[i] for i in chunk], len(chunk))
+            # Map chunk positions back to indices in the full documents list
+            return [(chunk[pos], score) for pos, score in scored if pos < len(chunk)]
+        
+        workers = min(RERANK_BATCH_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [pair for scored in executor.map(score_chunk, chunks) for pair in scored]
+    
+    def rerank_batch(
+        self,
+        queries: List[str],
+        documents: List[str],
+        top_n: Optional[int] = None,
+        lead_ids: Optional[List[str]] = None
+    ) -> List[List[RankedResult]]:
+        """Rerank against several queries, with the API calls in flight together."""
+        if len(queries) <= 1:
+            return super().rerank_batch(queries, documents, top_n, lead_ids)
+        
+        # The rerank endpoint takes one query per request, so overlap the
+        # round trips over the shared keep-alive client instead
+        workers = min(RERANK_BATCH_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda query: self.rerank(query, documents, top_n, lead_ids),
+                queries
+            ))
 
 
 class NoOpReranker(BaseReranker):
@@ -171,10 +395,14 @@ class NoOpReranker(BaseReranker):
 # class ZeroEntropyReranker(BaseReranker): ...
 
 
+@lru_cache(maxsize=4)
 def get_reranker(name: str = "jina") -> BaseReranker:
     """
     Factory function to get a reranker by name.
     
+    Instances are cached per name, so every caller shares one reranker
+    (and its keep-alive HTTP client) for the life of the process.
+    
     Args:
         name: Reranker name ("jina", "cohere", "noop", etc.)
     
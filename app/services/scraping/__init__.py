@@ -1,6 +1,6 @@
 # Scraping services
 from .apify_scraper import scraper, normalize_linkedin_url, extract_urn_from_url
-from .html_parser import extract_linkedin_urls
+from .html_parser import extract_linkedin_urls, extract_linkedin_urls_stream
 from .profile_id_utils import get_profile_id_from_profile, get_profile_id_from_post
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "normalize_linkedin_url", 
     "extract_urn_from_url",
     "extract_linkedin_urls",
+    "extract_linkedin_urls_stream",
     "get_profile_id_from_profile",
     "get_profile_id_from_post"
 ]
@@ -33,8 +33,7 @@ POSTS_ACTOR_ID = "Wpp1BZ6yGWjySadk3"    # LinkedIn Posts Scraper
 
 # Batch settings (matches original scrape_linkedin.py)
 URLS_PER_ACTOR = 5           # URLs sent to each actor call
-CONCURRENT_ACTORS = 20       # Actor runs in parallel
-DELAY_BETWEEN_GROUPS = 10    # Seconds between concurrent groups
+CONCURRENT_ACTORS = 20       # Max actor runs in flight at once
 
 # Timeout for Apify actor calls (30 minutes)
 APIFY_TIMEOUT_SECONDS = 1800
@@ -42,6 +41,10 @@ APIFY_TIMEOUT_SECONDS = 1800
 # Cache TTL for profile data (30 days)
 CACHE_TTL_DAYS = 30
 
+# URL patterns (compiled once - used for every URL we normalize/match)
+LINKEDIN_HOST_RE = re.compile(r'https?://(www\.)?linkedin\.com')
+PROFILE_SLUG_RE = re.compile(r'/in/([^/?]+)')
+
 
 # ============================================================================
 # URL UTILITIES
@@ -65,7 +68,7 @@ def normalize_linkedin_url(url: str) -> str:
     if not url.startswith('http'):
         url = 'https://' + url
     
-    url = re.sub(r'https?://(www\.)?linkedin\.com', 'https://www.linkedin.com', url)
+    url = LINKEDIN_HOST_RE.sub('https://www.linkedin.com', url)
     
     return url
 
@@ -74,12 +77,55 @@ def extract_urn_from_url(url: str) -> Optional[str]:
     """Extract the URN/username from a LinkedIn URL (preserves case)."""
     if not url:
         return None
-    match = re.search(r'/in/([^/?]+)', url)
+    match = PROFILE_SLUG_RE.search(url)
     if match:
         return match.group(1)
     return None
 
 
+def build_urn_lookup(urls: List[str]) -> Dict[str, str]:
+    """Map each URL's URN/username to the URL (extracting it once per URL)."""
+    urn_to_url = {}
+    for url in urls:
+        urn = extract_urn_from_url(url)
+        if urn:
+            urn_to_url[urn] = url
+    return urn_to_url
+
+
+class ScrapeResults(dict):
+    """
+    URL -> scrape result mapping that keeps its outcome counts up to date.
+    
+    Behaves like the plain dict callers already use; `stats` is maintained as
+    results are recorded, so summaries/progress never need another pass.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.stats = {"success": 0, "from_cache": 0, "failed": 0}
+    
+    def _count(self, result: Dict[str, Any], delta: int) -> None:
+        if result.get("success"):
+            self.stats["success"] += delta
+            if result.get("from_cache"):
+                self.stats["from_cache"] += delta
+        else:
+            self.stats["failed"] += delta
+    
+    def record(self, url: str, result: Dict[str, Any]) -> None:
+        """Store a result for url and update stats (replacing any earlier one)."""
+        previous = self.get(url)
+        if previous is not None:
+            self._count(previous, -1)
+        self[url] = result
+        self._count(result, 1)
+    
+    def record_all(self, results: Dict[str, Any]) -> None:
+        for url, result in results.items():
+            self.record(url, result)
+
+
 def get_default_scrape_until() -> str:
     """Get default scrape date (1 year ago from today)."""
     one_year_ago = datetime.utcnow().replace(year=datetime.utcnow().year - 1)
@@ -149,7 +195,7 @@ class ApifyScraper:
                 "scraped_at": datetime.utcnow().isoformat()
             }
             
-            supabase.table("profile_cache").upsert(cache_entry, on_conflict="linkedin_url").execute()
+            supabase.table("profile_cache").upsert(cache_entry, on_conflict="linkedin_url", returning="minimal").execute()
             return True
             
         except Exception as e:
@@ -300,11 +346,7 @@ class ApifyScraper:
                 print(f"[Batch {batch_num}] Successfully scraped {len(profiles)} profiles")
                 
                 # Build URN lookup for matching
-                urn_to_url = {}
-                for url in urls:
-                    urn = extract_urn_from_url(url)
-                    if urn:
-                        urn_to_url[urn] = url
+                urn_to_url = build_urn_lookup(urls)
                 
                 # Match profiles to URLs
                 for profile in profiles:
@@ -353,7 +395,7 @@ class ApifyScraper:
                                 list_items_result = await dataset_client.list_items()
                                 profiles = list(list_items_result.items) if hasattr(list_items_result, 'items') and list_items_result.items else []
                                 if profiles:
-                                    urn_to_url = {extract_urn_from_url(url): url for url in urls if extract_urn_from_url(url)}
+                                    urn_to_url = build_urn_lookup(urls)
                                     for profile in profiles:
                                         profile_urn = get_profile_id_from_profile(profile)
                                         original_url = urn_to_url.get(profile_urn) if profile_urn else None
@@ -413,26 +455,27 @@ class ApifyScraper:
         
         return results
     
-    async def scrape_profiles_concurrent(self, urls: List[str]) -> Dict[str, Any]:
+    async def scrape_profiles_concurrent(self, urls: List[str]) -> ScrapeResults:
         """
-        Scrape profiles with concurrent batching (20 actors × 5 URLs).
+        Scrape profiles with concurrent batching (up to 20 actors × 5 URLs in flight).
         Main entry point for profile scraping.
         
         Args:
             urls: List of LinkedIn profile URLs
         
         Returns:
-            Dict mapping URL -> scrape result
+            ScrapeResults mapping URL -> scrape result, with outcome counts in .stats
         """
+        results = ScrapeResults()
+        
         if not urls:
             print("No URLs provided!")
-            return {}
+            return results
         
         # Cleanup any orphaned actors first
         await self.cleanup_running_actors(PROFILE_ACTOR_ID)
         
         # Check cache first
-        results = {}
         urls_to_scrape = []
         
         print(f"\n[Scraper] Checking cache for {len(urls)} URLs...", flush=True)
@@ -442,11 +485,11 @@ class ApifyScraper:
             cached_data = self.check_cache(normalized_url)
             
             if cached_data:
-                results[normalized_url] = {
+                results.record(normalized_url, {
                     "success": True,
                     "from_cache": True,
                     "profile_data": cached_data
-                }
+                })
             else:
                 urls_to_scrape.append(normalized_url)
         
@@ -466,35 +509,33 @@ class ApifyScraper:
         print(f"Total batches: {len(batches)} (batch size: {URLS_PER_ACTOR})")
         print(f"Concurrent actors: {CONCURRENT_ACTORS}")
         
-        # Process batches in concurrent groups
-        for i in range(0, len(batches), CONCURRENT_ACTORS):
-            batch_group = batches[i:i + CONCURRENT_ACTORS]
-            batch_start = i + 1
-            batch_end = min(i + CONCURRENT_ACTORS, len(batches))
-            print(f"\n{'='*60}")
-            print(f"Processing batches {batch_start}-{batch_end} of {len(batches)}...")
-            print(f"{'='*60}")
-            
-            # Run batch_group concurrently with asyncio.gather
-            batch_tasks = [
-                self.scrape_profile_batch(batch_num, batch_urls) 
-                for batch_num, batch_urls in batch_group
-            ]
-            group_results = await asyncio.gather(*batch_tasks)
-            
-            # Merge results
-            for batch_result in group_results:
-                results.update(batch_result)
-            
-            # Delay between groups
-            if i + CONCURRENT_ACTORS < len(batches):
-                print(f"\nWaiting {DELAY_BETWEEN_GROUPS} seconds before next group...", flush=True)
-                await asyncio.sleep(DELAY_BETWEEN_GROUPS)
+        # Sliding window: up to CONCURRENT_ACTORS batches in flight, and a new
+        # one starts as soon as any finishes (no waiting on the slowest actor
+        # in a group). A batch that raises doesn't take the others down.
+        semaphore = asyncio.Semaphore(CONCURRENT_ACTORS)
         
-        # Summary
-        success_count = sum(1 for r in results.values() if r.get("success"))
-        cache_count = sum(1 for r in results.values() if r.get("from_cache"))
-        fail_count = sum(1 for r in results.values() if not r.get("success"))
+        async def run_batch(batch_num: int, batch_urls: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.scrape_profile_batch(batch_num, batch_urls)
+                except Exception as e:
+                    print(f"[Batch {batch_num}] Failed: {e}", flush=True)
+                    return {url: {"success": False, "error": str(e)} for url in batch_urls}
+        
+        batch_tasks = [run_batch(batch_num, batch_urls) for batch_num, batch_urls in batches]
+        
+        done = 0
+        for next_result in asyncio.as_completed(batch_tasks):
+            results.record_all(await next_result)
+            done += 1
+            stats = results.stats
+            print(f"[Scraper] {done}/{len(batches)} batches complete "
+                  f"({stats['success']} ok, {stats['failed']} failed)", flush=True)
+        
+        # Summary (counts were kept as results came in)
+        success_count = results.stats["success"]
+        cache_count = results.stats["from_cache"]
+        fail_count = results.stats["failed"]
         
         print(f"\n{'='*60}")
         print(f"SCRAPING COMPLETE")
@@ -640,24 +681,24 @@ class ApifyScraper:
         print(f"\nTotal URLs to scrape: {len(urls)}")
         print(f"Total batches: {len(batches)} (batch size: {URLS_PER_ACTOR})")
         
-        all_posts = []
+        print(f"Concurrent actors: {CONCURRENT_ACTORS}")
         
-        for i in range(0, len(batches), CONCURRENT_ACTORS):
-            batch_group = batches[i:i + CONCURRENT_ACTORS]
-            print(f"\nProcessing batches {i+1}-{min(i+CONCURRENT_ACTORS, len(batches))} of {len(batches)}...")
-            
-            batch_tasks = [
-                self.scrape_posts_batch(batch_num, batch_urls, scrape_until)
-                for batch_num, batch_urls in batch_group
-            ]
-            group_results = await asyncio.gather(*batch_tasks)
-            
-            for batch_posts in group_results:
-                all_posts.extend(batch_posts)
-            
-            if i + CONCURRENT_ACTORS < len(batches):
-                print(f"\nWaiting {DELAY_BETWEEN_GROUPS} seconds before next group...", flush=True)
-                await asyncio.sleep(DELAY_BETWEEN_GROUPS)
+        # Same sliding window as scrape_profiles_concurrent: up to
+        # CONCURRENT_ACTORS batches in flight, a new one starting as soon as
+        # any finishes. gather() keeps the posts in batch order.
+        semaphore = asyncio.Semaphore(CONCURRENT_ACTORS)
+        
+        async def run_batch(batch_num: int, batch_urls: List[str]) -> List[Dict]:
+            async with semaphore:
+                return await self.scrape_posts_batch(batch_num, batch_urls, scrape_until)
+        
+        batch_results = await asyncio.gather(*(
+            run_batch(batch_num, batch_urls) for batch_num, batch_urls in batches
+        ))
+        
+        all_posts = []
+        for batch_posts in batch_results:
+            all_posts.extend(batch_posts)
         
         print(f"\n[OK] Scraped {len(all_posts)} total posts from {len(urls)} profiles")
         return all_posts
@@ -8,8 +8,39 @@ Handles various LinkedIn export formats:
 """
 
 import re
-from typing import List, Set
-from bs4 import BeautifulSoup
+from html import unescape
+from typing import BinaryIO, Dict, List, Set, Union
+
+from .profile_id_utils import is_urn_style_id
+
+
+# Compiled once at import - these run per URL / over whole HTML exports
+LINKEDIN_HOST_RE = re.compile(r'https?://(www\.)?linkedin\.com', re.IGNORECASE)
+
+# LinkedIn profile URLs anywhere in raw HTML (hrefs, data-url attributes, text),
+# with or without scheme, with optional query params (also after a trailing
+# slash, e.g. /in/jdoe/?miniProfileUrn=...). Scheme and host match in any case,
+# as hrefs do; the slug's case is preserved for URN-style IDs; % allows
+# percent-encoded vanity slugs. Repeats are bounded (slugs/URNs are well under
+# 100 chars) so a malformed run of URL-ish bytes can't turn into one huge
+# match; a longer slug is rejected rather than cut short to a wrong profile.
+# Group 1 is the slug (username or URN).
+PROFILE_URL_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?linkedin\.com/in/([A-Za-z0-9_%-]{1,100})(?![A-Za-z0-9_%-])(?:/?\?[^"\'\s<>]{0,2048})?',
+    re.IGNORECASE
+)
+# Same pattern for bytes input (raw file contents / mmap) so it can be scanned without decoding
+PROFILE_URL_BYTES_RE = re.compile(PROFILE_URL_RE.pattern.encode(), re.IGNORECASE)
+
+# Streaming extraction: read size, bytes that can't appear inside a URL (chunk
+# boundaries are cut after the last one), and max carry-over without a delimiter
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_DELIMITERS = (b' ', b'\t', b'\n', b'\r', b'\f', b'\v', b'"', b"'", b'<', b'>')
+STREAM_MAX_TAIL = 64 * 1024
+
+# Usernames in plain text, with and without protocol
+PROFILE_USERNAME_RE = re.compile(r'https?://(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)', re.IGNORECASE)
+PROFILE_USERNAME_NO_PROTOCOL_RE = re.compile(r'(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)', re.IGNORECASE)
 
 
 def normalize_linkedin_url(url: str) -> str:
@@ -27,72 +58,120 @@ def normalize_linkedin_url(url: str) -> str:
     url = url.strip()
     
     # Check if it's a LinkedIn profile URL (case-insensitive check)
-    if 'linkedin.com/in/' not in url.lower():
+    url_lower = url.lower()
+    if 'linkedin.com/in/' not in url_lower:
         return ""
     
     # Ensure https:// prefix
-    if not url.startswith('http'):
+    if not url_lower.startswith('http'):
         url = 'https://' + url
     
     # Normalize to www.linkedin.com but preserve the rest (case and query params)
-    url = re.sub(r'https?://(www\.)?linkedin\.com', 'https://www.linkedin.com', url)
+    url = LINKEDIN_HOST_RE.sub('https://www.linkedin.com', url)
     
     return url
 
 
-def extract_linkedin_urls(html_content: str) -> List[str]:
+def _add_profile_url(urls: Dict[str, str], url: str, slug: str) -> None:
+    """
+    Normalize a regex match and add it to the results, one entry per profile.
+    
+    The same profile shows up with different schemes, hosts, tracking params
+    and (for usernames) case, so results are keyed by the /in/ slug. URN-style
+    IDs are case-sensitive and kept as-is; usernames are compared lowercased.
+    When a profile appears more than once, the URL with a query string wins
+    (the ?miniProfileUrn= param is needed for scraping).
+    """
+    key = slug if is_urn_style_id(slug) else slug.lower()
+    existing = urls.get(key)
+    if existing is not None and ('?' in existing or '?' not in url):
+        return
+    
+    # Attribute values are matched as written, so unescape HTML entities
+    # (e.g. &amp; in query strings)
+    if '&' in url:
+        url = unescape(url)
+    normalized = normalize_linkedin_url(url)
+    if normalized:
+        urls[key] = normalized
+
+
+def extract_linkedin_urls(html_content: Union[str, bytes, memoryview]) -> List[str]:
     """
     Extract unique LinkedIn profile URLs from HTML content.
     
     Args:
-        html_content: Raw HTML string
+        html_content: Raw HTML - a str, or any bytes-like buffer (bytes, mmap)
+            so large exports can be scanned without decoding them first
     
     Returns:
         List of normalized, unique LinkedIn profile URLs
     """
-    urls: Set[str] = set()
+    urls: Dict[str, str] = {}
     
-    # Method 1: Parse with BeautifulSoup and find all links
+    # Single regex pass over the raw markup - no DOM build
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        
-        # Find all anchor tags with href
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if 'linkedin.com/in/' in href.lower():
-                normalized = normalize_linkedin_url(href)
-                if normalized:
-                    urls.add(normalized)
-        
-        # Also check data attributes that might contain URLs
-        for element in soup.find_all(attrs={"data-url": True}):
-            data_url = element.get("data-url", "")
-            if 'linkedin.com/in/' in data_url.lower():
-                normalized = normalize_linkedin_url(data_url)
-                if normalized:
-                    urls.add(normalized)
+        if isinstance(html_content, str):
+            for match in PROFILE_URL_RE.finditer(html_content):
+                _add_profile_url(urls, match.group(0), match.group(1))
+        else:
+            for match in PROFILE_URL_BYTES_RE.finditer(html_content):
+                _add_profile_url(
+                    urls,
+                    match.group(0).decode('utf-8', errors='ignore'),
+                    match.group(1).decode('ascii')
+                )
     
     except Exception as e:
-        print(f"[Parser] BeautifulSoup parsing error: {e}")
+        print(f"[Parser] Regex parsing error: {e}")
     
-    # Method 2: Regex fallback for any URLs in the raw HTML
-    # This catches URLs that might not be in proper anchor tags
-    try:
-        # Match full LinkedIn profile URLs with optional query params
-        # Preserve original case for URN-style IDs
-        pattern = r'https?://(?:www\.)?linkedin\.com/in/[A-Za-z0-9_-]+(?:\?[^"\s<>]*)?'
-        matches = re.findall(pattern, html_content)
+    # Convert to sorted list for consistent ordering
+    result = sorted(urls.values())
+    
+    print(f"[Parser] Extracted {len(result)} unique LinkedIn URLs")
+    
+    return result
+
+
+def extract_linkedin_urls_stream(fileobj: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> List[str]:
+    """
+    Extract unique LinkedIn profile URLs from a binary file object, chunk by chunk.
+    
+    Same results as extract_linkedin_urls, but only one chunk (plus a short
+    carried-over tail) is in memory at a time.
+    
+    Args:
+        fileobj: File opened in binary mode (or any object with read(size) -> bytes)
+        chunk_size: Bytes to read per chunk
+    
+    Returns:
+        List of normalized, unique LinkedIn profile URLs
+    """
+    urls: Dict[str, str] = {}
+    tail = b''
+    
+    for chunk in iter(lambda: fileobj.read(chunk_size), b''):
+        buffer = tail + chunk
         
-        for url in matches:
-            normalized = normalize_linkedin_url(url)
-            if normalized:
-                urls.add(normalized)
+        # A URL can't contain whitespace, quotes or angle brackets, so any match
+        # crossing into the next chunk starts after the last such delimiter.
+        # Scan up to there and carry the rest over.
+        cut = max(buffer.rfind(d) for d in STREAM_DELIMITERS) + 1
+        if cut == 0 and len(buffer) <= STREAM_MAX_TAIL:
+            tail = buffer
+            continue
+        if cut == 0:
+            # No delimiter in a long run - nothing real spans this far, scan it all
+            cut = len(buffer)
+        
+        for match in PROFILE_URL_BYTES_RE.finditer(buffer, 0, cut):
+            _add_profile_url(urls, match.group(0).decode('utf-8', errors='ignore'), match.group(1).decode('ascii'))
+        tail = buffer[cut:]
     
-    except Exception as e:
-        print(f"[Parser] Regex parsing error: {e}")
+    for match in PROFILE_URL_BYTES_RE.finditer(tail):
+        _add_profile_url(urls, match.group(0).decode('utf-8', errors='ignore'), match.group(1).decode('ascii'))
     
-    # Convert to sorted list for consistent ordering
-    result = sorted(list(urls))
+    result = sorted(urls.values())
     
     print(f"[Parser] Extracted {len(result)} unique LinkedIn URLs")
     
@@ -117,19 +196,11 @@ def extract_urls_from_text(text: str) -> List[str]:
     urls: Set[str] = set()
     
     # Match linkedin.com/in/username patterns
-    pattern = r'https?://(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)'
-    matches = re.findall(pattern, text, re.IGNORECASE)
-    
-    for username in matches:
-        normalized = f"https://www.linkedin.com/in/{username.lower()}"
-        urls.add(normalized)
+    for match in PROFILE_USERNAME_RE.finditer(text):
+        urls.add(f"https://www.linkedin.com/in/{match.group(1).lower()}")
     
     # Also try to match just "linkedin.com/in/username" without protocol
-    pattern_no_protocol = r'(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)'
-    matches = re.findall(pattern_no_protocol, text, re.IGNORECASE)
-    
-    for username in matches:
-        normalized = f"https://www.linkedin.com/in/{username.lower()}"
-        urls.add(normalized)
+    for match in PROFILE_USERNAME_NO_PROTOCOL_RE.finditer(text):
+        urls.add(f"https://www.linkedin.com/in/{match.group(1).lower()}")
     
     return sorted(list(urls))
@@ -14,7 +14,11 @@ DECISION: We use the URN-style profileId as the canonical identifier everywhere
 This module provides helper functions that ALL code should use to extract profile IDs.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+# URN-style IDs: 'ACoAAA' prefix and ~43 characters long
+URN_PREFIX = 'ACoAAA'
+URN_MIN_LENGTH = 31
 
 
 def get_profile_id_from_post(post: Dict) -> Optional[str]:
@@ -32,11 +36,13 @@ def get_profile_id_from_post(post: Dict) -> Optional[str]:
     Returns:
         Profile ID string or None if not found
     """
-    author_obj = post.get('author', {})
+    # Type-check author once; both the preferred and last fallback read it
+    author_obj = post.get('author')
+    author_get = author_obj.get if isinstance(author_obj, dict) else None
     
-    if isinstance(author_obj, dict):
+    if author_get:
         # Preferred: URN-style profileId
-        profile_id = author_obj.get('profileId')
+        profile_id = author_get('profileId')
         if profile_id:
             return profile_id
     
@@ -46,10 +52,8 @@ def get_profile_id_from_post(post: Dict) -> Optional[str]:
         return profile_id
     
     # Fallback 2: author.publicId
-    if isinstance(author_obj, dict):
-        profile_id = author_obj.get('publicId')
-        if profile_id:
-            return profile_id
+    if author_get:
+        return author_get('publicId') or None
     
     return None
 
@@ -76,7 +80,7 @@ def get_profile_id_from_profile(profile: Dict) -> Optional[str]:
     
     # Sometimes the 'id' field contains the URN
     profile_id = profile.get('id')
-    if profile_id and profile_id.startswith('ACoAAA'):
+    if profile_id and profile_id.startswith(URN_PREFIX):
         return profile_id
     
     # Fallback: publicIdentifier (username-style)
@@ -97,24 +101,23 @@ def get_resharer_id(reshared_post: Dict) -> Optional[str]:
     Returns:
         Profile ID of the resharer or None
     """
+    get = reshared_post.get
+    
+    # Native reshares are the common case - check them first
     if 'resharedPost' in reshared_post:
-        author_obj = reshared_post.get('author', {})
+        author_obj = get('author')
         if isinstance(author_obj, dict):
             # Prefer URN-style
             author_id = author_obj.get('profileId')
             if author_id:
                 return author_id
         # Fallback to authorProfileId
-        author_id = reshared_post.get('authorProfileId')
-        if author_id:
-            return author_id
-            
-    elif reshared_post.get('isActivity') is True:
-        activity_user = reshared_post.get('activityOfUser', {})
+        return get('authorProfileId') or None
+    
+    if get('isActivity') is True:
+        activity_user = get('activityOfUser')
         if isinstance(activity_user, dict):
-            author_id = activity_user.get('profileId')
-            if author_id:
-                return author_id
+            return activity_user.get('profileId') or None
     
     return None
 
@@ -132,9 +135,29 @@ def is_urn_style_id(profile_id: str) -> bool:
     Returns:
         True if URN-style, False if username-style
     """
-    if not profile_id:
-        return False
-    return profile_id.startswith('ACoAAA') and len(profile_id) > 30
+    # Length test first: it's an int compare and rejects most usernames
+    return bool(profile_id) and len(profile_id) >= URN_MIN_LENGTH and profile_id.startswith(URN_PREFIX)
+
+
+def is_urn_style_id_batch(profile_ids: List[str]) -> List[bool]:
+    """
+    Check many profile IDs at once (same rules as is_urn_style_id).
+    
+    Use this instead of calling is_urn_style_id in a loop over large
+    collections - the check runs in a single comprehension with the
+    string methods bound once.
+    
+    Args:
+        profile_ids: Profile IDs to check (None/empty entries are allowed)
+    
+    Returns:
+        List of booleans, aligned with the input order
+    """
+    startswith = str.startswith
+    return [
+        bool(pid) and len(pid) >= URN_MIN_LENGTH and startswith(pid, URN_PREFIX)
+        for pid in profile_ids
+    ]
 
 
 def get_public_identifier(profile: Dict) -> Optional[str]:
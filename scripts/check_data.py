@@ -2,6 +2,7 @@
 
 import os
 import sys
+from collections import Counter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
@@ -21,12 +22,20 @@ for c in clients.data:
 
 # Check batches with lead counts
 batches = supabase.table("batches").select("id, client_id, status").execute()
+
+# One paged read of (batch_id, status) for all leads, counted locally,
+# instead of three count queries per batch
+lead_counts = Counter(
+    (lead["batch_id"], lead["status"])
+    for lead in supabase.table("leads").select("batch_id,status").order("id").iter_rows()
+)
+
 print(f"\nBATCHES ({len(batches.data)}):")
 for b in batches.data:
-    discovered = supabase.table("leads").select("id").eq("batch_id", b["id"]).eq("status", "discovered").execute()
-    enriched = supabase.table("leads").select("id").eq("batch_id", b["id"]).eq("status", "enriched").execute()
-    qualified = supabase.table("leads").select("id").eq("batch_id", b["id"]).eq("status", "qualified").execute()
-    print(f"  {b['id'][:8]}... - discovered:{len(discovered.data)} enriched:{len(enriched.data)} qualified:{len(qualified.data)}")
+    discovered = lead_counts[(b["id"], "discovered")]
+    enriched = lead_counts[(b["id"], "enriched")]
+    qualified = lead_counts[(b["id"], "qualified")]
+    print(f"  {b['id'][:8]}... - discovered:{discovered} enriched:{enriched} qualified:{qualified}")
 
 # Check ICPs
 icps = supabase.table("client_icps").select("*").execute()
@@ -2,19 +2,24 @@
 import sys
 sys.path.insert(0, ".")
 
+from collections import Counter
+
 from dotenv import load_dotenv
 load_dotenv()
 
-from app.services.supabase_client import supabase
+from app.services.db.supabase_client import supabase
 
 batch_id = "541581b9-4b08-4b0b-b01f-94c175b60df5"
 
+
+def count_statuses(batch_id: str) -> Counter:
+    """Count a batch's leads by status (paged, so large batches aren't truncated)."""
+    rows = supabase.table("leads").select("status").eq("batch_id", batch_id).order("id").iter_rows()
+    return Counter(lead.get("status") or "unknown" for lead in rows)
+
+
 # Check current status
-result = supabase.table("leads").select("status").eq("batch_id", batch_id).execute()
-status_counts = {}
-for lead in result.data:
-    s = lead.get("status", "unknown")
-    status_counts[s] = status_counts.get(s, 0) + 1
+status_counts = count_statuses(batch_id)
 
 print(f"\n=== Current Status ===")
 for status, count in sorted(status_counts.items()):
@@ -30,11 +35,7 @@ result = supabase.table("leads").update({
 print(f"Reset {len(result.data)} leads")
 
 # Verify
-result2 = supabase.table("leads").select("status").eq("batch_id", batch_id).execute()
-status_counts2 = {}
-for lead in result2.data:
-    s = lead.get("status", "unknown")
-    status_counts2[s] = status_counts2.get(s, 0) + 1
+status_counts2 = count_statuses(batch_id)
 
 print(f"\n=== After Reset ===")
 for status, count in sorted(status_counts2.items()):
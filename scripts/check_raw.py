@@ -11,7 +11,11 @@ load_dotenv(".env.local")
 from app.services.db.supabase_client import supabase
 
 # Get the lead with "8 yrs 1 mo" company
-leads = supabase.table("leads").select("id, name, company, profile_data").eq("name", "Chris Meringolo").execute()
+# Project just the two profile_data keys we inspect (JSON path select) so
+# the rest of the Apify blob (summary, skills, ...) never leaves Postgres
+leads = supabase.table("leads").select(
+    "id,name,company,company_name:profile_data->>companyName,positions:profile_data->positions"
+).eq("name", "Chris Meringolo").execute()
 
 if leads.data:
     lead = leads.data[0]
@@ -19,11 +23,10 @@ if leads.data:
     print(f"Company field: {lead['company']}")
     print()
     
-    profile_data = lead.get("profile_data") or {}
-    print(f"companyName: {profile_data.get('companyName')}")
+    print(f"companyName: {lead.get('company_name')}")
     print()
     
-    positions = profile_data.get("positions", [])
+    positions = lead.get("positions") or []
     print(f"Positions ({len(positions)}):")
     for i, pos in enumerate(positions[:3]):
         print(f"\n  Position {i+1}:")
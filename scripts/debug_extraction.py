@@ -14,28 +14,37 @@ print("="*60)
 print("DEBUGGING JOB TITLE EXTRACTION")
 print("="*60)
 
-leads = supabase.table("leads").select("name,current_job_titles,company,profile_data").eq("status", "qualified").execute()
+# Only positions + companyName feed title/company extraction, so project
+# those two keys instead of pulling each lead's full profile_data blob
+leads = supabase.table("leads").select(
+    "name,current_job_titles,company,company_name:profile_data->>companyName,positions:profile_data->positions"
+).eq("status", "qualified").execute()
 
+# Each lead's report is built up and written in one go rather than a print per line
 for lead in leads.data:
-    print(f"\n{'='*60}")
-    print(f"NAME: {lead['name']}")
-    print(f"CURRENT (stored): titles={lead.get('current_job_titles')}, company={lead.get('company')}")
+    lines = [
+        f"\n{'='*60}",
+        f"NAME: {lead['name']}",
+        f"CURRENT (stored): titles={lead.get('current_job_titles')}, company={lead.get('company')}",
+    ]
     
-    profile_data = lead.get("profile_data", {}) or {}
-    positions = profile_data.get("positions", [])
+    positions = lead.get("positions") or []
+    profile_data = {"positions": positions, "companyName": lead.get("company_name")}
     
-    print(f"\nRAW POSITIONS ({len(positions)} total):")
+    lines.append(f"\nRAW POSITIONS ({len(positions)} total):")
     for i, pos in enumerate(positions[:4]):
         title = pos.get("title")
         company = pos.get("company")
         time_period = pos.get("timePeriod", {}) or {}
         end_date = time_period.get("endDate")
         is_current = "CURRENT" if end_date is None else f"ended {end_date}"
-        print(f"  [{i}] title='{title}' | company={company} | {is_current}")
+        lines.append(f"  [{i}] title='{title}' | company={company} | {is_current}")
     
     # Re-extract to see what we'd get now
     re_extracted = extract_profile_fields(profile_data)
-    print(f"\nRE-EXTRACTED: titles={re_extracted.get('current_job_titles')}, company={re_extracted.get('company')}")
+    lines.append(f"\nRE-EXTRACTED: titles={re_extracted.get('current_job_titles')}, company={re_extracted.get('company')}")
     
     if re_extracted.get('current_job_titles') != lead.get('current_job_titles'):
-        print("  ^ MISMATCH - extraction logic may have changed")
+        lines.append("  ^ MISMATCH - extraction logic may have changed")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
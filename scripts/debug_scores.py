@@ -10,7 +10,10 @@ load_dotenv(".env.local")
 from app.services.db.supabase_client import supabase
 from app.services.matching.embeddings import create_profile_text
 from app.services.matching.reranker import get_reranker
-from app.services.matching.icp_matcher import expand_icp
+from app.services.matching.icp_matcher import build_icp_text
+
+# Build the reranker (and its HTTP client) up front rather than mid-run
+reranker = get_reranker("jina")
 
 print("="*60)
 print("DEBUGGING SCORES")
@@ -24,10 +27,10 @@ print("\nICP:")
 print(f"  Target titles: {icp.get('target_titles')}")
 print(f"  Target industries: {icp.get('target_industries')}")
 
-# Expand ICP
-expanded_icp = expand_icp(icp)
-print(f"\nExpanded ICP (query for reranker):")
-print(f"  {expanded_icp}")
+# Build ICP text (same query qualify_batch sends to the reranker)
+icp_text = build_icp_text(icp)
+print(f"\nICP text (query for reranker):")
+print(f"  {icp_text}")
 
 # Get leads
 leads = supabase.table("leads").select("*").eq("status", "qualified").execute()
@@ -38,26 +41,29 @@ print("-"*60)
 
 documents = []
 lead_names = []
+lines = []
 
 for lead in leads.data:
     profile_text = create_profile_text(lead)
     documents.append(profile_text)
     lead_names.append(lead.get("name", "Unknown"))
-    print(f"\n{lead.get('name')}:")
-    print(f"  {profile_text[:300]}...")
+    lines.append(f"\n{lead.get('name')}:")
+    lines.append(f"  {profile_text[:300]}...")
+
+# One write for the whole section instead of a print per line
+sys.stdout.write("\n".join(lines) + "\n")
 
 # Rerank
 print("\n" + "-"*60)
 print("RERANKER SCORES:")
 print("-"*60)
 
-reranker = get_reranker("jina")
-results = reranker.rerank(
-    query=expanded_icp,
-    documents=documents
-)
+# The reranker splits long document lists into concurrent requests itself
+results = reranker.rerank(query=icp_text, documents=documents)
 
+lines = []
 for result in results:
     idx = result.index
     name = lead_names[idx] if idx < len(lead_names) else "Unknown"
-    print(f"  {name}: {result.score:.4f} (x100 = {int(result.score * 100)})")
+    lines.append(f"  {name}: {result.score:.4f} (x100 = {int(result.score * 100)})")
+sys.stdout.write("\n".join(lines) + "\n")
@@ -14,7 +14,7 @@ from app.services.enrichment import extract_profile_fields
 leads = supabase.table("leads").select("id, name, profile_data, company").in_("status", ["enriched", "qualified"]).execute()
 print(f"Found {len(leads.data)} leads to check")
 
-fixed = 0
+updates = []
 for lead in leads.data:
     profile_data = lead.get("profile_data") or {}
     fields = extract_profile_fields(profile_data)
@@ -23,7 +23,9 @@ for lead in leads.data:
     
     if new_company != old_company:
         print(f"  {lead['name']}: '{old_company}' -> '{new_company}'")
-        supabase.table("leads").update({"company": new_company}).eq("id", lead["id"]).execute()
-        fixed += 1
+        updates.append({"id": lead["id"], "company": new_company})
+
+# Send the PATCHes concurrently rather than one round-trip per lead
+fixed = supabase.update_rows("leads", updates)
 
 print(f"\nFixed {fixed} leads")
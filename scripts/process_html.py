@@ -21,8 +21,8 @@ from pathlib import Path
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.services.supabase_client import supabase
-from app.services.html_parser import extract_linkedin_urls
+from app.services.db.supabase_client import supabase
+from app.services.scraping import extract_linkedin_urls_stream
 from app.services.enrichment import create_leads_from_urls
 
 
@@ -88,12 +88,9 @@ async def process_file(client_name: str, filename: str) -> dict:
     print(f"Client: {client_name}")
     print(f"{'='*60}")
     
-    # Read HTML
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        html_content = f.read()
-    
-    # Extract URLs
-    urls = extract_linkedin_urls(html_content)
+    # Extract URLs, streaming the file in chunks rather than reading it whole
+    with open(filepath, 'rb') as f:
+        urls = extract_linkedin_urls_stream(f)
     
     if not urls:
         print(f"⚠️  No LinkedIn URLs found in {filename}")
@@ -12,7 +12,7 @@ load_dotenv(".env.local")
 import asyncio
 from app.services.db.supabase_client import supabase
 from app.services.enrichment import extract_profile_fields
-from app.services.matching.embeddings import generate_profile_embedding, format_embedding_for_postgres, create_profile_text
+from app.services.matching.embeddings import generate_embeddings, format_embedding_for_postgres, create_profile_text
 from app.services.matching.classifier import classify_profile
 from app.services.matching.icp_matcher import qualify_batch
 
@@ -30,8 +30,11 @@ async def main():
     print("STEP 1: Re-extracting profile fields...")
     print("-"*60)
     
+    profile_texts = []
+    updates = []
+    lines = []
+    
     for lead in leads.data:
-        lead_id = lead["id"]
         name = lead.get("name", "Unknown")
         profile_data = lead.get("profile_data") or {}
         
@@ -49,26 +52,32 @@ async def main():
             "current_job_titles": fields.get("current_job_titles"),
             "industry": lead.get("industry"),
         }
+        profile_texts.append(create_profile_text(lead_for_embedding))
         
-        # Generate new embedding
-        embedding = generate_profile_embedding(lead_for_embedding)
-        
-        print(f"\n{name}:")
-        print(f"  Titles: {fields.get('current_job_titles')}")
-        print(f"  Company: {fields.get('company')}")
+        lines.append(f"\n{name}:")
+        lines.append(f"  Titles: {fields.get('current_job_titles')}")
+        lines.append(f"  Company: {fields.get('company')}")
         
-        # Update database
-        update_data = {
+        updates.append({
+            "id": lead["id"],
             "current_job_titles": fields.get("current_job_titles"),
             "company": fields.get("company"),
             "status": "enriched"  # Reset for re-qualification
-        }
-        
+        })
+    
+    # Emit the per-lead report in one write instead of three prints per lead
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Generate new embeddings in batched API calls rather than one per lead
+    embeddings = generate_embeddings(profile_texts)
+    for update_data, embedding in zip(updates, embeddings):
         if embedding:
             update_data["embedding"] = format_embedding_for_postgres(embedding)
-            print(f"  Embedding: Generated")
-        
-        supabase.table("leads").update(update_data).eq("id", lead_id).execute()
+    print(f"\nEmbeddings: Generated {sum(1 for e in embeddings if e)}/{len(embeddings)}")
+    
+    # Write all updates concurrently
+    updated = supabase.update_rows("leads", updates)
+    print(f"Updated {updated}/{len(updates)} leads")
     
     # Step 2: Re-qualify
     print("\n" + "-"*60)
@@ -92,13 +101,15 @@ async def main():
     
     qualified = supabase.table("leads").select("*").eq("status", "qualified").order("icp_score", desc=True).execute()
     
+    lines = []
     for i, lead in enumerate(qualified.data):
         titles = lead.get("current_job_titles") or []
         title_str = ", ".join(titles[:2]) if titles else "Unknown"
-        print(f"\n{i+1}. {lead.get('name')} - Score: {lead.get('icp_score')}/100")
-        print(f"   Titles: {title_str}")
-        print(f"   Company: {lead.get('company')}")
-        print(f"   Industry: {lead.get('industry')}")
+        lines.append(f"\n{i+1}. {lead.get('name')} - Score: {lead.get('icp_score')}/100")
+        lines.append(f"   Titles: {title_str}")
+        lines.append(f"   Company: {lead.get('company')}")
+        lines.append(f"   Industry: {lead.get('industry')}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n" + "="*60)
 
@@ -10,84 +10,113 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv(".env.local")
+from concurrent.futures import ThreadPoolExecutor
 
-from app.services.db.supabase_client import supabase
-from app.services.matching.icp_matcher import qualify_batch
+batch_id = "97ac8489-4365-4d29-b5d0-66b18aa24f28"
+lead_columns = "id,name,current_job_titles,company,industry,icp_score"
 
-# Get Allison's ICP
-client_result = supabase.table("clients").select("id").eq("name", "Allison Gates").execute()
-if not client_result.data:
-    print("ERROR: Allison Gates client not found!")
-    exit(1)
 
-client_id = client_result.data[0]["id"]
-icp_result = supabase.table("client_icps").select("*").eq("client_id", client_id).execute()
-icp = icp_result.data[0] if icp_result.data else None
+def fetch_client(supabase):
+    """Allison's client row with her ICP embedded (one request, not two)."""
+    return supabase.table("clients").select(
+        "id,client_icps(target_titles,target_industries)"
+    ).eq("name", "Allison Gates").execute().data
 
-if not icp:
-    print("ERROR: ICP not found!")
-    exit(1)
 
-print("="*60)
-print("LANGSMITH EVALS SETUP")
-print("="*60)
+def fetch_leads(supabase, desc: bool):
+    """Top (desc) or bottom 10 qualified leads - only the columns we read."""
+    return supabase.table("leads").select(lead_columns).eq("batch_id", batch_id).eq("status", "qualified").order("icp_score", desc=desc).limit(10).execute().data
 
-print(f"\nICP Criteria:")
-print(f"  Titles: {icp.get('target_titles')}")
-print(f"  Industries: {icp.get('target_industries')}")
 
-# Get qualified leads to create test cases
-leads = supabase.table("leads").select("*").eq("batch_id", "97ac8489-4365-4d29-b5d0-66b18aa24f28").eq("status", "qualified").order("icp_score", desc=True).execute()
+def main():
+    from dotenv import load_dotenv
+    load_dotenv(".env.local")
+    
+    from app.services.db.supabase_client import supabase
+    
+    # The leads queries don't depend on the client lookup, so run all three at once
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        client_future = pool.submit(fetch_client, supabase)
+        top_future = pool.submit(fetch_leads, supabase, True)
+        bottom_future = pool.submit(fetch_leads, supabase, False)
+        client_rows = client_future.result()
+        top_leads = top_future.result()
+        # Ascending for the bottom 10, then reversed to keep the highest-first display order
+        bottom_leads = bottom_future.result()[::-1]
+    
+    # Get Allison's ICP
+    if not client_rows:
+        print("ERROR: Allison Gates client not found!")
+        exit(1)
+    
+    # Embedded one-to-one resources come back as an object (or a list on older PostgREST)
+    icp = client_rows[0].get("client_icps")
+    if isinstance(icp, list):
+        icp = icp[0] if icp else None
+    
+    if not icp:
+        print("ERROR: ICP not found!")
+        exit(1)
+    
+    print("="*60)
+    print("LANGSMITH EVALS SETUP")
+    print("="*60)
+    
+    print(f"\nICP Criteria:")
+    print(f"  Titles: {icp.get('target_titles')}")
+    print(f"  Industries: {icp.get('target_industries')}")
+    
+    print(f"\nFetched top {len(top_leads)} / bottom {len(bottom_leads)} qualified leads")
+    
+    # Create test cases: top 10 (should be good), bottom 10 (should be bad)
+    test_cases = []
+    
+    # Good matches (top scores)
+    print("\n" + "-"*60)
+    print("GOOD MATCHES (top 10 - should score 60+):")
+    print("-"*60)
+    for i, lead in enumerate(top_leads, 1):
+        titles = lead.get("current_job_titles") or []
+        title_str = ", ".join(titles[:2]) if titles else "No titles"
+        score = lead.get("icp_score", 0)
+        test_cases.append({
+            "lead_id": lead["id"],
+            "name": lead.get("name"),
+            "titles": title_str,
+            "company": lead.get("company"),
+            "industry": lead.get("industry"),
+            "expected_score_min": 60,
+            "expected_score_max": 100,
+            "type": "good_match"
+        })
+        print(f"{i}. {lead.get('name')}: {title_str} | {lead.get('company')} | Score: {score}")
+    
+    # Bad matches (bottom 10)
+    print("\n" + "-"*60)
+    print("BAD MATCHES (bottom 10 - should score <50):")
+    print("-"*60)
+    for i, lead in enumerate(bottom_leads, 1):
+        titles = lead.get("current_job_titles") or []
+        title_str = ", ".join(titles[:2]) if titles else "No titles"
+        score = lead.get("icp_score", 0)
+        test_cases.append({
+            "lead_id": lead["id"],
+            "name": lead.get("name"),
+            "titles": title_str,
+            "company": lead.get("company"),
+            "industry": lead.get("industry"),
+            "expected_score_min": 0,
+            "expected_score_max": 50,
+            "type": "bad_match"
+        })
+        print(f"{i}. {lead.get('name')}: {title_str} | {lead.get('company')} | Score: {score}")
+    
+    print(f"\n" + "="*60)
+    print(f"Created {len(test_cases)} test cases")
+    print(f"="*60)
+    print(f"\nNext: Run evals with:")
+    print(f"  python scripts/run_evals.py")
 
-print(f"\nFound {len(leads.data)} qualified leads")
 
-# Create test cases: top 10 (should be good), bottom 10 (should be bad)
-test_cases = []
-
-# Good matches (top scores)
-print("\n" + "-"*60)
-print("GOOD MATCHES (top 10 - should score 60+):")
-print("-"*60)
-for i, lead in enumerate(leads.data[:10], 1):
-    titles = lead.get("current_job_titles") or []
-    title_str = ", ".join(titles[:2]) if titles else "No titles"
-    score = lead.get("icp_score", 0)
-    test_cases.append({
-        "lead_id": lead["id"],
-        "name": lead.get("name"),
-        "titles": title_str,
-        "company": lead.get("company"),
-        "industry": lead.get("industry"),
-        "expected_score_min": 60,
-        "expected_score_max": 100,
-        "type": "good_match"
-    })
-    print(f"{i}. {lead.get('name')}: {title_str} | {lead.get('company')} | Score: {score}")
-
-# Bad matches (bottom 10)
-print("\n" + "-"*60)
-print("BAD MATCHES (bottom 10 - should score <50):")
-print("-"*60)
-for i, lead in enumerate(leads.data[-10:], 1):
-    titles = lead.get("current_job_titles") or []
-    title_str = ", ".join(titles[:2]) if titles else "No titles"
-    score = lead.get("icp_score", 0)
-    test_cases.append({
-        "lead_id": lead["id"],
-        "name": lead.get("name"),
-        "titles": title_str,
-        "company": lead.get("company"),
-        "industry": lead.get("industry"),
-        "expected_score_min": 0,
-        "expected_score_max": 50,
-        "type": "bad_match"
-    })
-    print(f"{i}. {lead.get('name')}: {title_str} | {lead.get('company')} | Score: {score}")
-
-print(f"\n" + "="*60)
-print(f"Created {len(test_cases)} test cases")
-print(f"="*60)
-print(f"\nNext: Run evals with:")
-print(f"  python scripts/run_evals.py")
+if __name__ == "__main__":
+    main()
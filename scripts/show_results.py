@@ -4,20 +4,27 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv(".env.local")
 
-from app.services.db.supabase_client import supabase
+def main():
+    from dotenv import load_dotenv
+    load_dotenv(".env.local")
+    
+    from app.services.db.supabase_client import supabase
+    
+    leads = supabase.table("leads").select("name, current_job_titles, company, industry, icp_score, match_reasoning").eq("status", "qualified").order("icp_score", desc=True).execute()
+    
+    # Build the whole report, then write it once
+    lines = ["QUALIFIED LEADS (sorted by score):", "="*60]
+    for i, lead in enumerate(leads.data):
+        titles = lead.get("current_job_titles") or []
+        title_str = ", ".join(titles[:2]) if titles else "Unknown"
+        lines.append(f"\n{i+1}. {lead.get('name')} - Score: {lead.get('icp_score')}/100")
+        lines.append(f"   Titles: {title_str}")
+        lines.append(f"   Company: {lead.get('company')}")
+        lines.append(f"   Industry: {lead.get('industry')}")
+        lines.append(f"   Reason: {lead.get('match_reasoning')}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-leads = supabase.table("leads").select("name, current_job_titles, company, industry, icp_score, match_reasoning").eq("status", "qualified").order("icp_score", desc=True).execute()
 
-print("QUALIFIED LEADS (sorted by score):")
-print("="*60)
-for i, lead in enumerate(leads.data):
-    titles = lead.get("current_job_titles") or []
-    title_str = ", ".join(titles[:2]) if titles else "Unknown"
-    print(f"\n{i+1}. {lead.get('name')} - Score: {lead.get('icp_score')}/100")
-    print(f"   Titles: {title_str}")
-    print(f"   Company: {lead.get('company')}")
-    print(f"   Industry: {lead.get('industry')}")
-    print(f"   Reason: {lead.get('match_reasoning')}")
+if __name__ == "__main__":
+    main()
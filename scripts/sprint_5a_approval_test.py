@@ -12,6 +12,7 @@ This script is safe to run multiple times.
 from __future__ import annotations
 
 import json
+import random
 import time
 from typing import Any, Dict, Optional
 
@@ -24,35 +25,55 @@ BASE_URL = "http://localhost:8001"
 ALLISON_CLIENT_ID = "867a2eb0-6655-4fa8-9e25-f4a1d6e26859"
 BEN_BATCH_ID = "541581b9-4b08-4b0b-b01f-94c175b60df5"
 
+# Shared session so every call (including the polling loop) reuses one
+# keep-alive connection instead of reconnecting per request
+SESSION = requests.Session()
+
 
 def _pretty(obj: Any) -> str:
     return json.dumps(obj, indent=2, ensure_ascii=False)
 
 
 def _get(path: str) -> Dict[str, Any]:
-    r = requests.get(f"{BASE_URL}{path}", timeout=30)
+    r = SESSION.get(f"{BASE_URL}{path}", timeout=30)
     r.raise_for_status()
     return r.json()
 
 
 def _post(path: str, json_body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    r = requests.post(f"{BASE_URL}{path}", json=json_body, timeout=300)
+    r = SESSION.post(f"{BASE_URL}{path}", json=json_body, timeout=300)
     r.raise_for_status()
     return r.json()
 
 
+# Long-poll hold per request (server caps at 60s; keep under _get's 30s timeout)
+LONG_POLL_S = 20
+
+
 def _poll_batch(batch_id: str, target_status: str, timeout_s: int = 180, interval_s: int = 5) -> Dict[str, Any]:
+    """
+    Wait for a batch to reach target_status.
+    
+    Each GET long-polls (?wait_for=) so the server answers as soon as the status
+    flips; between attempts we back off exponentially (0.25s, 0.5s, ... capped at
+    interval_s) with jitter, so fast jobs return quickly and slow ones don't spam.
+    """
     start = time.time()
     last = None
+    attempt = 0
     while time.time() - start < timeout_s:
-        data = _get(f"/batches/{batch_id}")
+        remaining = timeout_s - (time.time() - start)
+        wait = max(1, int(min(LONG_POLL_S, remaining)))
+        data = _get(f"/batches/{batch_id}?wait_for={target_status}&timeout={wait}")
         last = data
         status = (data.get("batch") or {}).get("status")
         counts = data.get("lead_counts") or {}
         print(f"[poll] status={status} counts={counts}")
         if status == target_status:
             return data
-        time.sleep(interval_s)
+        delay = min(interval_s, 0.25 * 2 ** attempt)
+        attempt += 1
+        time.sleep(delay / 2 + random.uniform(0, delay / 2))
     raise TimeoutError(f"Timed out waiting for batch {batch_id} to reach status={target_status}. Last={last}")
 
 
@@ -101,12 +122,16 @@ def main() -> None:
 
     # 4) Export CSV
     print("\n[4/5] Export CSV (Ben batch)")
-    csv_resp = requests.get(f"{BASE_URL}/batches/{BEN_BATCH_ID}/export", timeout=60)
-    csv_resp.raise_for_status()
     out_path = "ben_sprint_5a_export.csv"
-    with open(out_path, "wb") as f:
-        f.write(csv_resp.content)
-    print(f"Wrote {out_path} ({len(csv_resp.content)} bytes)")
+    written = 0
+    # Stream to disk in chunks rather than holding the whole CSV in memory
+    with SESSION.get(f"{BASE_URL}/batches/{BEN_BATCH_ID}/export", stream=True, timeout=60) as csv_resp:
+        csv_resp.raise_for_status()
+        with open(out_path, "wb") as f:
+            for chunk in csv_resp.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+                written += len(chunk)
+    print(f"Wrote {out_path} ({written} bytes)")
 
     # 5) Run orchestrator in background (limit=5)
     print("\n[5/5] Background run orchestrator (Ben batch, limit=5)")
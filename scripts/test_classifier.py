@@ -8,15 +8,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
-load_dotenv(".env.local")
-load_dotenv()
-
-from app.services.matching.classifier import classify_profile
-
-print("=" * 50)
-print("Classifier Test")
-print("=" * 50)
+from concurrent.futures import ThreadPoolExecutor
 
 # Test profile 1: SaaS startup
 sample_lead_1 = {
@@ -36,17 +28,6 @@ sample_lead_1 = {
     }
 }
 
-print("\n1. Testing SaaS/Fintech profile...")
-print(f"   Profile: {sample_lead_1['name']} - {sample_lead_1['headline']}")
-result1 = classify_profile(sample_lead_1)
-if result1:
-    print(f"   ✓ Industry: {result1['industry']}")
-    print(f"     Reasoning: {result1['industry_reasoning']}")
-    print(f"   ✓ Company Type: {result1['company_type']}")
-    print(f"     Reasoning: {result1['company_reasoning']}")
-else:
-    print("   ✗ Classification failed")
-
 # Test profile 2: Enterprise consulting
 sample_lead_2 = {
     "name": "Michael Roberts",
@@ -65,17 +46,6 @@ sample_lead_2 = {
     }
 }
 
-print("\n2. Testing Enterprise Consulting profile...")
-print(f"   Profile: {sample_lead_2['name']} - {sample_lead_2['headline']}")
-result2 = classify_profile(sample_lead_2)
-if result2:
-    print(f"   ✓ Industry: {result2['industry']}")
-    print(f"     Reasoning: {result2['industry_reasoning']}")
-    print(f"   ✓ Company Type: {result2['company_type']}")
-    print(f"     Reasoning: {result2['company_reasoning']}")
-else:
-    print("   ✗ Classification failed")
-
 # Test profile 3: Healthcare startup
 sample_lead_3 = {
     "name": "Dr. Emily Wong",
@@ -94,17 +64,43 @@ sample_lead_3 = {
     }
 }
 
-print("\n3. Testing Healthcare/AI startup profile...")
-print(f"   Profile: {sample_lead_3['name']} - {sample_lead_3['headline']}")
-result3 = classify_profile(sample_lead_3)
-if result3:
-    print(f"   ✓ Industry: {result3['industry']}")
-    print(f"     Reasoning: {result3['industry_reasoning']}")
-    print(f"   ✓ Company Type: {result3['company_type']}")
-    print(f"     Reasoning: {result3['company_reasoning']}")
-else:
-    print("   ✗ Classification failed")
 
-print("\n" + "=" * 50)
-print("✅ Classifier test complete!")
-print("=" * 50)
+def main():
+    from dotenv import load_dotenv
+    load_dotenv(".env.local")
+    load_dotenv()
+    
+    from app.services.matching.classifier import classify_profile
+    
+    print("=" * 50)
+    print("Classifier Test")
+    print("=" * 50)
+    
+    test_cases = [
+        ("SaaS/Fintech", sample_lead_1),
+        ("Enterprise Consulting", sample_lead_2),
+        ("Healthcare/AI startup", sample_lead_3),
+    ]
+    
+    # Each classification is an independent OpenAI call - run them in parallel
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as pool:
+        results = list(pool.map(classify_profile, [lead for _, lead in test_cases]))
+    
+    for i, ((label, lead), result) in enumerate(zip(test_cases, results), 1):
+        print(f"\n{i}. Testing {label} profile...")
+        print(f"   Profile: {lead['name']} - {lead['headline']}")
+        if result:
+            print(f"   ✓ Industry: {result['industry']}")
+            print(f"     Reasoning: {result['industry_reasoning']}")
+            print(f"   ✓ Company Type: {result['company_type']}")
+            print(f"     Reasoning: {result['company_reasoning']}")
+        else:
+            print("   ✗ Classification failed")
+    
+    print("\n" + "=" * 50)
+    print("✅ Classifier test complete!")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from app.services.supabase_client import supabase
-from app.services.apify_scraper import scraper
+from app.services.db.supabase_client import supabase
+from app.services.scraping.apify_scraper import scraper
 
 BATCH_ID = "541581b9-4b08-4b0b-b01f-94c175b60df5"
 
@@ -44,7 +44,7 @@ async def main():
         print(f"    ... and {len(urls) - 5} more")
     
     # Run concurrent scraping
-    print(f"\n[3] Starting concurrent scraping (20 actors × 5 URLs)...")
+    print(f"\n[3] Starting concurrent scraping (up to 20 actors × 5 URLs in flight)...")
     print("-" * 60)
     
     results = await scraper.scrape_profiles_concurrent(urls)
@@ -53,13 +53,12 @@ async def main():
     print("\n" + "=" * 60)
     print("RESULTS")
     print("=" * 60)
-    success = sum(1 for r in results.values() if r.get("success"))
-    cached = sum(1 for r in results.values() if r.get("from_cache"))
-    failed = sum(1 for r in results.values() if not r.get("success"))
+    # The scraper keeps these counts as results come in - no extra pass needed
+    stats = results.stats
     
     print(f"  Total: {len(results)}")
-    print(f"  Success: {success} ({cached} from cache)")
-    print(f"  Failed: {failed}")
+    print(f"  Success: {stats['success']} ({stats['from_cache']} from cache)")
+    print(f"  Failed: {stats['failed']}")
 
 
 if __name__ == "__main__":
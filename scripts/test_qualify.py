@@ -13,13 +13,35 @@ load_dotenv(".env.local")
 from app.services.db.supabase_client import supabase
 from app.services.matching.icp_matcher import qualify_batch
 
+# Rows per request when reading a batch's enriched leads
+ENRICHED_PAGE_SIZE = 500
+
+# Qualified leads shown in the final report (highest scores first)
+QUALIFIED_DISPLAY_LIMIT = 50
+
+# Max Supabase requests this script has in flight at once
+DB_CONCURRENCY = 10
+_db_semaphore = asyncio.Semaphore(DB_CONCURRENCY)
+
+
+async def _db(call):
+    """
+    Await a Supabase call, with at most DB_CONCURRENCY in flight.
+    
+    Pass a query builder's execute_async() for single requests, or
+    asyncio.to_thread(fn) for other blocking work (paged reads).
+    """
+    async with _db_semaphore:
+        return await call
+
+
 async def main():
     print("="*60)
     print("QUALIFICATION PIPELINE TEST")
     print("="*60)
     
     # Get client and batch
-    clients = supabase.table("clients").select("id, name").execute()
+    clients = await _db(supabase.table("clients").select("id, name").execute_async())
     if not clients.data:
         print("ERROR: No clients found.")
         return
@@ -28,7 +50,21 @@ async def main():
     client_id = client["id"]
     print(f"\nClient: {client['name']}")
     
-    batches = supabase.table("batches").select("id, status").eq("client_id", client_id).execute()
+    icp_data = {
+        "client_id": client_id,
+        "target_titles": ["CEO", "Founder", "CTO", "VP Engineering", "Head of Product", "Director"],
+        "target_industries": ["SaaS", "AI", "Technology", "Software", "Fintech"],
+        "company_sizes": ["startup", "scaleup", "mid-market"],
+        "target_keywords": ["B2B", "enterprise", "growth"],
+        "notes": "Looking for tech executives at growing companies"
+    }
+    
+    # Batches read and ICP upsert both only need client_id - send them together.
+    # Upsert on client_id is one round-trip whether or not the ICP exists yet.
+    batches, _ = await asyncio.gather(
+        _db(supabase.table("batches").select("id, status").eq("client_id", client_id).execute_async()),
+        _db(supabase.table("client_icps").upsert(icp_data, on_conflict="client_id", returning="minimal").execute_async()),
+    )
     if not batches.data:
         print("ERROR: No batches found.")
         return
@@ -42,24 +78,7 @@ async def main():
     print("STEP 1: Setting up ICP...")
     print("-"*60)
     
-    icp_data = {
-        "client_id": client_id,
-        "target_titles": ["CEO", "Founder", "CTO", "VP Engineering", "Head of Product", "Director"],
-        "target_industries": ["SaaS", "AI", "Technology", "Software", "Fintech"],
-        "company_sizes": ["startup", "scaleup", "mid-market"],
-        "target_keywords": ["B2B", "enterprise", "growth"],
-        "notes": "Looking for tech executives at growing companies"
-    }
-    
-    # Upsert ICP
-    existing = supabase.table("client_icps").select("id").eq("client_id", client_id).execute()
-    if existing.data:
-        supabase.table("client_icps").update(icp_data).eq("client_id", client_id).execute()
-        print("Updated existing ICP")
-    else:
-        supabase.table("client_icps").insert(icp_data).execute()
-        print("Created new ICP")
-    
+    print("Saved ICP")
     print(f"  Target titles: {icp_data['target_titles']}")
     print(f"  Target industries: {icp_data['target_industries']}")
     
@@ -68,22 +87,26 @@ async def main():
     print("STEP 2: Checking enriched leads...")
     print("-"*60)
     
-    enriched = supabase.table("leads").select("*").eq("batch_id", batch_id).eq("status", "enriched").execute()
-    print(f"  Found {len(enriched.data)} enriched leads")
+    # Paged read (500 rows per request) so batches past PostgREST's 1000-row
+    # response cap aren't silently truncated
+    enriched_query = supabase.table("leads").select("id, name, current_job_titles").eq("batch_id", batch_id).eq("status", "enriched").order("id")
+    enriched_leads = await _db(asyncio.to_thread(lambda: list(enriched_query.iter_rows(ENRICHED_PAGE_SIZE))))
+    print(f"  Found {len(enriched_leads)} enriched leads")
     
-    if not enriched.data:
+    if not enriched_leads:
         print("ERROR: No enriched leads to qualify. Run enrichment first.")
         return
     
     # Show the leads we're about to qualify
-    print("\nLeads to qualify:")
-    for lead in enriched.data:
+    lines = ["\nLeads to qualify:"]
+    for lead in enriched_leads:
         titles = lead.get("current_job_titles") or []
-        print(f"  - {lead.get('name', 'Unknown')}: {', '.join(titles) if titles else 'No title'}")
+        lines.append(f"  - {lead.get('name', 'Unknown')}: {', '.join(titles) if titles else 'No title'}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Step 3: Run qualification
     print("\n" + "-"*60)
-    print(f"STEP 3: Qualifying {len(enriched.data)} leads...")
+    print(f"STEP 3: Qualifying {len(enriched_leads)} leads...")
     print("-"*60)
     
     result = await qualify_batch(batch_id, icp_data)
@@ -93,19 +116,19 @@ async def main():
     print("STEP 4: Results")
     print("-"*60)
     
-    qualified = supabase.table("leads").select("name, current_job_titles, company, industry, icp_score, match_reasoning").eq("batch_id", batch_id).eq("status", "qualified").order("icp_score", desc=True).execute()
+    qualified = await _db(supabase.table("leads").select("name, current_job_titles, company, industry, icp_score, match_reasoning").eq("batch_id", batch_id).eq("status", "qualified").order("icp_score", desc=True).limit(QUALIFIED_DISPLAY_LIMIT).execute_async())
     
-    print(f"\nQualified leads (sorted by score):")
-    print("-"*60)
+    lines = [f"\nTop {len(qualified.data)} qualified leads (sorted by score):", "-"*60]
     for i, lead in enumerate(qualified.data):
         titles = lead.get("current_job_titles") or []
         title_str = ", ".join(titles) if titles else "Unknown"
-        print(f"\n{i+1}. {lead.get('name', 'Unknown')}")
-        print(f"   Score: {lead.get('icp_score', 0)}/100")
-        print(f"   Title: {title_str}")
-        print(f"   Company: {lead.get('company', 'Unknown')}")
-        print(f"   Industry: {lead.get('industry', 'Unknown')}")
-        print(f"   Reason: {lead.get('match_reasoning', '')}")
+        lines.append(f"\n{i+1}. {lead.get('name', 'Unknown')}")
+        lines.append(f"   Score: {lead.get('icp_score', 0)}/100")
+        lines.append(f"   Title: {title_str}")
+        lines.append(f"   Company: {lead.get('company', 'Unknown')}")
+        lines.append(f"   Industry: {lead.get('industry', 'Unknown')}")
+        lines.append(f"   Reason: {lead.get('match_reasoning', '')}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n" + "="*60)
     print("TEST COMPLETE")
@@ -51,16 +51,14 @@ print("-" * 50)
 
 try:
     reranker = get_reranker("jina")
-    results = reranker.rerank(query, documents, top_n=5)
+    results = reranker.rerank_batch([query], documents, top_n=5)[0]
     
-    print(f"\n✓ Reranker returned {len(results)} results\n")
-    
-    print("Ranked Results:")
-    print("-" * 50)
+    lines = [f"\n✓ Reranker returned {len(results)} results\n", "Ranked Results:", "-" * 50]
     for i, result in enumerate(results, 1):
-        print(f"{i}. Score: {result.score:.4f}")
-        print(f"   {result.text[:70]}...")
-        print()
+        lines.append(f"{i}. Score: {result.score:.4f}")
+        lines.append(f"   {result.text[:70]}...")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
     
 except Exception as e:
     print(f"\n✗ Error: {e}")
@@ -74,9 +72,9 @@ print("-" * 50)
 noop = get_reranker("noop")
 noop_results = noop.rerank(query, documents, top_n=5)
 
-print("\nOriginal order (first 5):")
-for i, result in enumerate(noop_results, 1):
-    print(f"{i}. {result.text[:60]}...")
+lines = ["\nOriginal order (first 5):"]
+lines.extend(f"{i}. {result.text[:60]}..." for i, result in enumerate(noop_results, 1))
+sys.stdout.write("\n".join(lines) + "\n")
 
 print("\n" + "=" * 50)
 print("✅ Reranker test complete!")